@@ -0,0 +1,320 @@
+"""Headless HTTP API for parsing, section generation and DOCX rendering.
+
+    python api_server.py [--host 127.0.0.1] [--port 8080]
+
+    POST /parse                 multipart `file` (PDF/DOCX) or {"text": "..."}
+    POST /generate/{section}    {"data": {...form data...}, ...section args}
+    POST /render                {"data": {...}, "template": "simple|sidebar|modern"}
+    GET  /metrics               LLM client, ATS parse and CPU pool counters
+    GET  /health
+
+Runs on aiohttp. CPU-bound steps (pdf/docx extraction, DOCX rendering)
+go to a bounded process pool (503 when it is full); LLM-bound steps (ATS
+parse, generation) go to a thread pool, where llm_scheduler still bounds
+what reaches Ollama, at BATCH priority. Malformed bodies get a 400.
+A generated section that is the offline fallback (the LLM was down, busy
+or timed out) comes back with "fallback": true.
+"""
+import argparse
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+import ats_parser
+import llm_client
+from cpu_pool import BoundedProcessPool, PoolBusy
+from llm_scheduler import BATCH, priority_scope
+from resume_extract import (
+    MAX_UPLOAD_BYTES, MIME_TYPES, UploadTooLarge, extract_bytes, mime_type_for
+)
+from resume_core.generate import (
+    generate_best_summary, generate_declaration_llama, generate_experience_llama,
+    generate_projects_llama, generate_summary_llama, generate_technical_llama
+)
+from resume_core.parse import is_scanned, parse_resume_text
+from resume_core.render import TEMPLATES, render_docx_bytes
+from section_deps import is_fallback
+
+# ---------------------------------------
+# SERVER CONFIG
+# ---------------------------------------
+CPU_WORKERS = int(os.environ.get("RESUME_API_CPU_WORKERS", str(max(1, os.cpu_count() or 1))))
+CPU_MAX_QUEUED = int(os.environ.get("RESUME_API_CPU_MAX_QUEUED", str(4 * CPU_WORKERS)))
+LLM_WORKERS = int(os.environ.get("RESUME_API_LLM_WORKERS", "16"))
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+CPU_POOL = web.AppKey("cpu_pool", BoundedProcessPool)
+LLM_POOL = web.AppKey("llm_pool", ThreadPoolExecutor)
+
+# ---------------------------------------
+# REQUEST VALIDATION
+# ---------------------------------------
+# form-data fields the generators and templates read, by shape; anything
+# else in "data" is dropped
+TEXT_FIELDS = (
+    "name", "email", "phone", "location", "summary", "technical_skills_ai",
+    "experience", "projects", "declaration",
+)
+LIST_FIELDS = ("skills_list", "languages", "soft_options")
+EDUCATION_FIELDS = ("course", "school", "board", "sgpa", "startyear", "stopyear")
+
+
+def _text(obj, key, where=""):
+    value = obj.get(key)
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if not isinstance(value, str):
+        raise ValueError(f"{where}{key} must be a string")
+    return value
+
+
+def _string_list(obj, key):
+    items = obj.get(key)
+    if items is None:
+        return []
+    if not isinstance(items, list):
+        raise ValueError(f"data.{key} must be a list of strings")
+    values = []
+    for item in items:
+        # the wizard's older {"skill": "..."} entries
+        if isinstance(item, dict):
+            item = item.get("skill")
+        if not isinstance(item, str):
+            raise ValueError(f"data.{key} must be a list of strings")
+        values.append(item)
+    return values
+
+
+def form_data(body):
+    """The body's "data" object, checked and coerced to the shapes the
+    generators and templates expect. Raises ValueError on bad input."""
+    data = body.get("data")
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError("data must be an object")
+
+    clean = {key: _text(data, key, "data.") for key in TEXT_FIELDS}
+    clean.update({key: _string_list(data, key) for key in LIST_FIELDS})
+
+    education = data.get("education")
+    if education is None:
+        education = []
+    if not isinstance(education, list) or not all(isinstance(e, dict) for e in education):
+        raise ValueError("data.education must be a list of objects")
+    clean["education"] = [
+        {key: _text(entry, key, "data.education[].") for key in EDUCATION_FIELDS}
+        for entry in education
+    ]
+    return clean
+
+
+def _years(body):
+    value = body.get("years_of_exp")
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError("years_of_exp must be a whole number")
+
+
+def _flag(body, key):
+    value = body.get(key, False)
+    if not isinstance(value, bool):
+        raise ValueError(f"{key} must be true or false")
+    return value
+
+
+# section → (argument parser, generator); the parser runs on the event loop
+# so bad input is rejected before any LLM work is queued
+GENERATORS = {
+    "summary": (
+        lambda body: (form_data(body), _text(body, "user_summary")),
+        generate_summary_llama,
+    ),
+    "best_summary": (
+        lambda body: (_text(body, "user_input"),),
+        generate_best_summary,
+    ),
+    "technical_skills": (
+        lambda body: (form_data(body),),
+        generate_technical_llama,
+    ),
+    "experience": (
+        lambda body: (
+            form_data(body), _flag(body, "is_fresher"), _years(body), _text(body, "exp_text")
+        ),
+        generate_experience_llama,
+    ),
+    "projects": (
+        lambda body: (form_data(body), _text(body, "project_text")),
+        generate_projects_llama,
+    ),
+    "declaration": (
+        lambda body: (form_data(body), _text(body, "user_text")),
+        generate_declaration_llama,
+    ),
+}
+
+
+def _bad_request(message):
+    return web.json_response({"error": message}, status=400)
+
+
+def _server_busy():
+    return web.json_response({"error": "server busy, try again shortly"}, status=503)
+
+
+async def _json_body(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+def _as_batch(fn, *args):
+    # API clients are bulk callers: their LLM calls queue behind the
+    # wizard's interactive ones
+    with priority_scope(BATCH):
+        return fn(*args)
+
+
+async def _in_threads(request, fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(request.app[LLM_POOL], _as_batch, fn, *args)
+
+
+async def _in_processes(request, fn, *args):
+    # wait=0: never block the event loop on a queue slot; PoolBusy → 503
+    return await asyncio.wrap_future(request.app[CPU_POOL].submit(fn, *args, wait=0))
+
+
+# ---------------------------------------
+# HANDLERS
+# ---------------------------------------
+async def parse(request):
+    if request.content_type == "multipart/form-data":
+        form = await request.post()
+        upload = form.get("file")
+        if not isinstance(upload, web.FileField):
+            return _bad_request("expected a multipart field named 'file'")
+        mime_type = upload.content_type
+        if mime_type not in MIME_TYPES.values():
+            mime_type = mime_type_for(upload.filename or "")
+        if not mime_type:
+            return _bad_request("only PDF and DOCX uploads are supported")
+        try:
+            resume_text = await _in_processes(
+                request, extract_bytes, upload.file.read(), mime_type
+            )
+        except UploadTooLarge as e:
+            return web.json_response({"error": str(e)}, status=413)
+        except PoolBusy:
+            return _server_busy()
+    else:
+        body = await _json_body(request)
+        if body is None or not isinstance(body.get("text"), str):
+            return _bad_request("expected a file upload or {\"text\": ...}")
+        resume_text = body["text"]
+
+    parsed = await _in_threads(request, parse_resume_text, resume_text)
+    return web.json_response({"parsed": parsed, "scanned": is_scanned(resume_text)})
+
+
+async def generate(request):
+    section = request.match_info["section"]
+    if section not in GENERATORS:
+        raise web.HTTPNotFound(text=f"unknown section {section!r}; one of {sorted(GENERATORS)}")
+    parse_args, generator = GENERATORS[section]
+
+    body = await _json_body(request)
+    if body is None:
+        return _bad_request("expected a JSON object")
+    try:
+        args = parse_args(body)
+        text = await _in_threads(request, generator, *args)
+    except ValueError as e:
+        return _bad_request(str(e))
+    return web.json_response(
+        {"section": section, "text": text, "fallback": is_fallback(text)}
+    )
+
+
+async def render(request):
+    body = await _json_body(request)
+    if body is None or not isinstance(body.get("data"), dict):
+        return _bad_request("expected {\"data\": {...}, \"template\": ...}")
+    template = body.get("template", "simple")
+    if template not in TEMPLATES:
+        return _bad_request(f"template must be one of {sorted(TEMPLATES)}")
+    try:
+        data = form_data(body)
+    except ValueError as e:
+        return _bad_request(str(e))
+
+    try:
+        docx_bytes = await _in_processes(request, render_docx_bytes, data, template)
+    except PoolBusy:
+        return _server_busy()
+    return web.Response(
+        body=docx_bytes,
+        content_type=DOCX_MIME,
+        headers={"Content-Disposition": 'attachment; filename="resume.docx"'},
+    )
+
+
+async def metrics(request):
+    return web.json_response({
+        "llm": llm_client.metrics(),
+        "ats_parse": ats_parser.metrics(),
+        "cpu_pool": request.app[CPU_POOL].metrics(),
+    })
+
+
+async def health(request):
+    return web.json_response({"status": "ok"})
+
+
+# ---------------------------------------
+# APP
+# ---------------------------------------
+async def _pools(app):
+    # spawn-context workers: this process runs threads (the LLM pool)
+    app[CPU_POOL] = BoundedProcessPool(workers=CPU_WORKERS, max_queued=CPU_MAX_QUEUED)
+    app[LLM_POOL] = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="api-llm")
+    yield
+    app[LLM_POOL].shutdown(wait=False, cancel_futures=True)
+    app[CPU_POOL].shutdown()
+
+
+def make_app():
+    # multipart framing on top of the file itself
+    app = web.Application(client_max_size=MAX_UPLOAD_BYTES + 64 * 1024)
+    app.cleanup_ctx.append(_pools)
+    app.add_routes([
+        web.post("/parse", parse),
+        web.post("/generate/{section}", generate),
+        web.post("/render", render),
+        web.get("/metrics", metrics),
+        web.get("/health", health),
+    ])
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+    web.run_app(make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
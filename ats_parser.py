@@ -0,0 +1,299 @@
+import copy
+import json
+import threading
+import time
+
+import llm_client
+import skills_taxonomy
+from json_stream import ObjectStream
+
+# ---------------------------------------
+# ATS RECORD SHAPE
+# ---------------------------------------
+ATS_DEFAULTS = {
+    "name": "",
+    "email": "",
+    "phone": "",
+    "location": "",
+    "summary": "",
+    "education": [],
+    "skills_list": [],
+    "languages": [],
+    "soft_options": [],
+    "experience_raw": "",
+    "projects_raw": "",
+    "declaration_raw": ""
+}
+
+EDUCATION_FIELDS = ("course", "school", "board", "startyear", "stopyear", "sgpa")
+
+
+def _schema_for(value):
+    if isinstance(value, list):
+        return {"type": "array", "items": {"type": "string"}}
+    return {"type": "string"}
+
+
+# sent as Ollama's `format`, so the model can only produce this shape
+ATS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **{k: _schema_for(v) for k, v in ATS_DEFAULTS.items()},
+        "education": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {f: {"type": "string"} for f in EDUCATION_FIELDS},
+                "required": list(EDUCATION_FIELDS),
+            },
+        },
+    },
+    "required": list(ATS_DEFAULTS),
+}
+
+MAX_RESUME_CHARS = 6000
+
+
+def empty_record():
+    return copy.deepcopy(ATS_DEFAULTS)
+
+
+# ---------------------------------------
+# PARSE METRICS
+# ---------------------------------------
+class _ParseStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.strict = 0             # parsed by json.loads as returned
+        self.repaired = 0           # needed repair_json
+        self.failed = 0             # LLM error or unparseable even after repair
+        self.repair_attempts = 0    # repaired + failed-after-repair
+        self.repair_seconds = 0.0
+        self.repair_max = 0.0
+
+
+_stats = _ParseStats()
+
+
+def metrics():
+    with _stats.lock:
+        calls = _stats.calls
+        return {
+            "calls": calls,
+            "strict": _stats.strict,
+            "repaired": _stats.repaired,
+            "failed": _stats.failed,
+            "failure_rate": round(_stats.failed / calls, 4) if calls else 0.0,
+            "repair_rate": round(_stats.repaired / calls, 4) if calls else 0.0,
+            "repair_ms_avg": round(1000 * _stats.repair_seconds / _stats.repair_attempts, 2)
+            if _stats.repair_attempts else 0.0,
+            "repair_ms_max": round(1000 * _stats.repair_max, 2),
+        }
+
+
+def _record(outcome, repair_seconds=0.0):
+    with _stats.lock:
+        _stats.calls += 1
+        setattr(_stats, outcome, getattr(_stats, outcome) + 1)
+        if repair_seconds:
+            _stats.repair_attempts += 1
+            _stats.repair_seconds += repair_seconds
+            _stats.repair_max = max(_stats.repair_max, repair_seconds)
+
+
+# ---------------------------------------
+# PARSE
+# ---------------------------------------
+def build_prompt(resume_text):
+    return f"""
+Extract the resume below into the JSON schema you were given.
+
+Rules:
+- Copy values from the resume; use "" or [] when a field is missing
+- skills_list, languages and soft_options are lists of short names
+- experience_raw, projects_raw and declaration_raw keep the resume's own wording
+
+Resume:
+\"\"\"{resume_text[:MAX_RESUME_CHARS]}\"\"\"
+"""
+
+
+def parse_json(raw):
+    """Strict json.loads first; repair_json (timed) only when that fails.
+    Returns (result, outcome, repair_seconds); outcome is "strict",
+    "repaired" or "failed"."""
+    try:
+        return json.loads(raw), "strict", 0.0
+    except json.JSONDecodeError:
+        pass
+
+    from json_repair import repair_json
+
+    started = time.perf_counter()
+    try:
+        result = json.loads(repair_json(raw))
+    except (ValueError, TypeError):
+        result = None
+    elapsed = time.perf_counter() - started
+    if isinstance(result, (dict, list)) and result:
+        return result, "repaired", elapsed
+    return None, "failed", elapsed
+
+
+def parse_resume(resume_text, model):
+    try:
+        response = llm_client.chat(
+            model=model,
+            messages=[{"role": "user", "content": build_prompt(resume_text)}],
+            format=ATS_SCHEMA,
+            options={"temperature": 0}
+        )
+        raw = response["message"]["content"]
+    except Exception:
+        _record("failed")
+        return empty_record()
+
+    result, outcome, repair_seconds = parse_json(raw)
+    _record(outcome, repair_seconds)
+    return result if result is not None else empty_record()
+
+
+def parse_resume_stream(resume_text, model, on_field):
+    """parse_resume, streamed: on_field(key, value) is called as each
+    top-level field of the reply completes, so the UI can fill in while
+    the rest is still generating. Returns the full record at the end."""
+    fields = ObjectStream()
+    pieces = []
+    stream = llm_client.chat_stream(
+        model=model,
+        messages=[{"role": "user", "content": build_prompt(resume_text)}],
+        format=ATS_SCHEMA,
+        options={"temperature": 0}
+    )
+
+    while True:
+        # only the LLM side counts as a parse failure, not on_field
+        try:
+            piece = next(stream)
+        except StopIteration:
+            break
+        except Exception:
+            _record("failed")
+            return empty_record()
+
+        pieces.append(piece)
+        for key, value in fields.feed(piece):
+            on_field(key, value)
+
+    result, outcome, repair_seconds = parse_json("".join(pieces))
+    _record(outcome, repair_seconds)
+    return result if result is not None else empty_record()
+
+
+# ---------------------------------------
+# NORMALIZE (ANY SHAPE → ATS_DEFAULTS SHAPE)
+# ---------------------------------------
+#used for mismatch structure
+def normalize_ats_data(p):
+    if isinstance(p, list):
+        p = empty_record()
+
+    # 🔑 FIX 2: ATS returned None or garbage
+    if not isinstance(p, dict):
+        p = {}
+
+    # 🔧 PROFILE → SUMMARY FALLBACK
+    if not p.get("summary") and p.get("profile"):
+        if isinstance(p["profile"], str):
+            p["summary"] = p["profile"]
+        elif isinstance(p["profile"], dict):
+            p["summary"] = p["profile"].get("text", "")
+
+    # 🔧 FIX SUMMARY
+    summary = p.get("summary", "")
+    if isinstance(summary, dict):
+        p["summary"] = summary.get("text", "")
+    elif isinstance(summary, list):
+        p["summary"] = " ".join(map(str, summary))
+    else:
+        p["summary"] = str(summary)
+
+    # Lists
+    for k in ["skills_list", "languages", "soft_options"]:
+        val= p.get(k,[])
+        if isinstance(p.get(k), str):
+            p[k] = [x.strip() for x in p[k].split(",") if x.strip()]
+        elif isinstance(val , list):
+            p[k] = val
+        else:
+            p[k] =[]
+    # 🔧 FIX: Separate Technical vs Soft Skills (via the shared taxonomy)
+    tech_skills = []
+    soft_skills = skills_taxonomy.normalize_skills(p.get("soft_options", []))  # preserve ATS soft skills
+    skill_langs = []
+
+    for s in p.get("skills_list", []):
+        skill = ""
+        skill_type = ""
+
+        if isinstance(s, dict):
+            skill = s.get("skill", "").strip()
+            skill_type = s.get("type", "").lower()
+        else:
+            skill = str(s).strip()
+            skill_type = ""
+
+        if not skill:
+            continue
+
+        skill_category = skills_taxonomy.category(skill)
+        if skill_category == skills_taxonomy.SOFT or skill_type == "soft":
+            soft_skills.append(skill)
+        elif skill_category == skills_taxonomy.LANGUAGE:
+            skill_langs.append(skill)
+        else:
+            tech_skills.append(skill)
+
+    # "js" / "JavaScript" / "javascript" collapse to one canonical entry
+    p["skills_list"] = sorted(skills_taxonomy.normalize_skills(tech_skills))
+    p["soft_options"] = sorted(skills_taxonomy.normalize_skills(soft_skills))
+
+    # 🔧 FIX LANGUAGES (ALL ATS FORMATS)
+    langs = []
+
+    raw_langs = p.get("languages", [])
+
+# string → split
+    if isinstance(raw_langs, str):
+        raw_langs = [x.strip() for x in raw_langs.split(",") if x.strip()]
+
+# list → normalize
+    if isinstance(raw_langs, list):
+        for l in raw_langs:
+            if isinstance(l, dict):
+                lang = l.get("language") or l.get("name") or ""
+                if lang:
+                    langs.append(lang.strip())
+            elif isinstance(l, str):
+                langs.append(l.strip())
+
+    p["languages"] = sorted(skills_taxonomy.normalize_skills(langs + skill_langs))
+
+    # Education
+    edu_clean = []
+    for e in p.get("education", []):
+        if not isinstance(e, dict):
+            continue
+        edu_clean.append({f: e.get(f, "") for f in EDUCATION_FIELDS})
+    p["education"] = edu_clean
+
+    # Text fields
+    for k in ["experience_raw","projects_raw","declaration_raw","summary"]:
+        p[k] = p.get(k,"")
+
+    # 🔑 FIX 3: Ensure all keys exist
+    for k, v in ATS_DEFAULTS.items():
+        p.setdefault(k, copy.deepcopy(v))
+
+    return p
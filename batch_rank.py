@@ -0,0 +1,251 @@
+"""Rank a folder of resumes against one job description.
+
+    python batch_rank.py index resumes/ [more files or folders ...]
+    python batch_rank.py rank job.txt -k 20
+
+`index` extracts new or changed files (through resume_extract, in a
+process pool) and appends them to a persisted sparse term matrix;
+`rank` scores every indexed resume with BM25 in a few sparse matrix
+operations and keeps the top-k with a heap.
+"""
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+
+from jd_match import BM25_B, BM25_K1, terms
+from resume_extract import MIME_TYPES, extract_file
+
+# ---------------------------------------
+# BATCH CONFIG
+# ---------------------------------------
+INDEX_DIR = os.environ.get("RESUME_INDEX_DIR", "resume_index")
+EXTRACT_WORKERS = max(1, os.cpu_count() or 1)
+DEFAULT_TOP_K = 10
+
+RankedResume = namedtuple("RankedResume", ["doc_id", "score", "matched_terms"])
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _extract(path):
+    # runs in a worker process; an unreadable file is skipped, not fatal
+    try:
+        return terms(extract_file(path))
+    except Exception:
+        return None
+
+
+# ---------------------------------------
+# CORPUS INDEX
+# ---------------------------------------
+class ResumeIndex:
+    """Documents × terms count matrix (CSR) plus its vocabulary, persisted
+    as matrix.npz + meta.json. Re-adding a document replaces its row."""
+
+    def __init__(self, path=INDEX_DIR):
+        self.path = path
+        self.vocab = {}             # term → column
+        self.terms = []             # column → term
+        self.doc_ids = []
+        self.digests = []
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._pending = []          # (doc_id, digest, term ids)
+        self._stats = None          # CSC copy, idf, doc lengths; rebuilt lazily
+
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            self.terms = meta["vocab"]
+            self.vocab = {t: i for i, t in enumerate(self.terms)}
+            self.doc_ids = meta["doc_ids"]
+            self.digests = meta["digests"]
+            self.matrix = sparse.load_npz(os.path.join(path, "matrix.npz")).tocsr()
+        self._digest_of = dict(zip(self.doc_ids, self.digests))
+
+    def __len__(self):
+        return len(self._digest_of)
+
+    def digest_of(self, doc_id):
+        return self._digest_of.get(doc_id)
+
+    def add(self, doc_id, doc_terms, digest=""):
+        ids = []
+        for t in doc_terms:
+            i = self.vocab.get(t)
+            if i is None:
+                i = self.vocab[t] = len(self.terms)
+                self.terms.append(t)
+            ids.append(i)
+        self._pending.append((doc_id, digest, ids))
+        self._digest_of[doc_id] = digest
+        self._stats = None
+
+    def _merge(self):
+        if not self._pending:
+            return
+        pending = {doc_id: (digest, ids) for doc_id, digest, ids in self._pending}
+        self._pending = []
+
+        # replaced documents lose their old row
+        keep = [i for i, d in enumerate(self.doc_ids) if d not in pending]
+        old = self.matrix[keep] if len(keep) != len(self.doc_ids) else self.matrix
+        self.doc_ids = [self.doc_ids[i] for i in keep]
+        self.digests = [self.digests[i] for i in keep]
+
+        rows, cols = [], []
+        for row, (doc_id, (digest, ids)) in enumerate(pending.items()):
+            self.doc_ids.append(doc_id)
+            self.digests.append(digest)
+            rows.extend([row] * len(ids))
+            cols.extend(ids)
+
+        n_terms = len(self.vocab)
+        new = sparse.csr_matrix(
+            (np.ones(len(cols), dtype=np.float32), (rows, cols)),
+            shape=(len(pending), n_terms),
+        )
+        new.sum_duplicates()
+        old.resize((old.shape[0], n_terms))
+        self.matrix = sparse.vstack([old, new], format="csr")
+
+    def save(self):
+        self._merge()
+        os.makedirs(self.path, exist_ok=True)
+        sparse.save_npz(os.path.join(self.path, "matrix.npz"), self.matrix)
+
+        tmp = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"vocab": self.terms, "doc_ids": self.doc_ids, "digests": self.digests}, f)
+        os.replace(tmp, os.path.join(self.path, "meta.json"))
+
+    def _ranking_stats(self):
+        if self._stats is None:
+            self._merge()
+            m = self.matrix
+            n_docs = m.shape[0]
+            df = np.bincount(m.indices, minlength=m.shape[1])
+            idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+            lengths = np.asarray(m.sum(axis=1)).ravel()
+            # column slices are what ranking needs, so keep a CSC copy
+            self._stats = (m.tocsc(), idf, lengths, lengths.mean() if n_docs else 1.0)
+        return self._stats
+
+    def rank(self, jd_text, k=DEFAULT_TOP_K):
+        """Top-k (doc_id, BM25 score, matched JD terms), best first."""
+        csc, idf, lengths, avg = self._ranking_stats()
+        query = sorted({self.vocab[t] for t in terms(jd_text) if t in self.vocab})
+        if not query or not csc.shape[0]:
+            return []
+
+        sub = csc[:, query].tocsr()
+        doc_rows = np.repeat(np.arange(sub.shape[0]), np.diff(sub.indptr))
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_rows] / (avg or 1.0))
+        sub.data = sub.data * (BM25_K1 + 1) / (sub.data + norm) * idf[query][sub.indices]
+        scores = np.asarray(sub.sum(axis=1)).ravel()
+
+        candidates = np.flatnonzero(scores)
+        top = heapq.nlargest(k, candidates, key=scores.__getitem__)
+
+        return [
+            RankedResume(
+                self.doc_ids[row],
+                float(scores[row]),
+                [self.terms[query[c]] for c in sub.indices[sub.indptr[row]:sub.indptr[row + 1]]],
+            )
+            for row in top
+        ]
+
+
+# ---------------------------------------
+# BULK INDEXING
+# ---------------------------------------
+def iter_resume_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in MIME_TYPES:
+                        yield os.path.join(root, name)
+        elif os.path.splitext(path)[1].lower() in MIME_TYPES:
+            yield path
+
+
+def index_resumes(index, paths, workers=EXTRACT_WORKERS):
+    """Extract and add every new or changed resume; returns how many were
+    (re)indexed. Unchanged files are skipped by content hash."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    todo = []
+    added = 0
+    for path in iter_resume_paths(paths):
+        doc_id = os.path.abspath(path)
+        digest = file_digest(path)
+        if index.digest_of(doc_id) != digest:
+            todo.append((doc_id, digest))
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (doc_id, digest), doc_terms in zip(
+                todo, pool.map(_extract, [d for d, _ in todo], chunksize=8)
+            ):
+                if doc_terms is not None:
+                    index.add(doc_id, doc_terms, digest)
+                    added += 1
+        index.save()
+    return added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index", default=INDEX_DIR, help="index directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p_index = commands.add_parser("index", help="add resumes (files or folders)")
+    p_index.add_argument("paths", nargs="+")
+    p_index.add_argument("--workers", type=int, default=EXTRACT_WORKERS)
+
+    p_rank = commands.add_parser("rank", help="rank indexed resumes against a JD")
+    p_rank.add_argument("jd", help="job description text file ('-' for stdin)")
+    p_rank.add_argument("-k", type=int, default=DEFAULT_TOP_K)
+
+    args = parser.parse_args(argv)
+    index = ResumeIndex(args.index)
+
+    if args.command == "index":
+        started = time.perf_counter()
+        added = index_resumes(index, args.paths, args.workers)
+        print(f"indexed {added} resume(s), {len(index)} total "
+              f"in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+        return
+
+    if args.jd == "-":
+        jd_text = sys.stdin.read()
+    else:
+        with open(args.jd, encoding="utf-8") as f:
+            jd_text = f.read()
+
+    started = time.perf_counter()
+    results = index.rank(jd_text, args.k)
+    for n, r in enumerate(results, 1):
+        print(f"{n:>3}. {r.score:7.2f}  {r.doc_id}  [{', '.join(r.matched_terms)}]")
+    print(f"ranked {len(index)} resume(s) in "
+          f"{(time.perf_counter() - started) * 1000:.0f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
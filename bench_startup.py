@@ -0,0 +1,147 @@
+"""Cold-start benchmark for the Streamlit apps.
+
+Measures interpreter start → first paint (first full script run of the
+landing page) in a fresh process, and fails when a heavy dependency is
+imported on that page, a time budget is exceeded, or resume_core (the
+Streamlit-free core) pulls in Streamlit.
+
+    python bench_startup.py            # both apps
+    python bench_startup.py r2.py      # one app
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+APPS = ["r2.py", "res1.py"]
+
+# must not be imported before the user uploads a file or downloads a resume
+HEAVY_MODULES = [
+    "pdfplumber", "pdfminer", "docx", "lxml", "ollama", "json_repair", "httpx", "numpy"
+]
+
+# our own modules imported on every script run of a landing page, measured
+# with -X importtime; resume_core's parse/generate/render load on first use
+LOCAL_MODULES = [
+    "draft_store", "job_runner", "cpu_pool", "skills_taxonomy", "snapshot",
+    "disk_cache", "ocr_fallback", "resume_extract", "section_deps",
+    "resume_core", "resume_core.boilerplate",
+    "llm_client", "llm_scheduler", "llm_resilience"
+]
+
+LOCAL_IMPORT_BUDGET_MS = 50
+FIRST_PAINT_BUDGET_MS = 4000
+
+CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "streamlit_import_ms": (t1 - t0) * 1000,
+    "first_run_ms": (t2 - t1) * 1000,
+    "exceptions": [str(e.value) for e in at.exception],
+    "loaded": sorted({m.split(".")[0] for m in sys.modules} & set(json.loads(sys.argv[2]))),
+}))
+"""
+
+
+LOCAL_IMPORT_RUNS = 3
+
+
+def _local_import_us(env):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(LOCAL_MODULES)],
+        capture_output=True, text=True, check=True, env=env
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        # cumulative time of top-level imports only: a nested local module
+        # is already counted in its importer's cumulative time
+        if len(parts) != 3 or parts[2][1:2].isspace():
+            continue
+        if parts[2].strip() in LOCAL_MODULES:
+            total_us += int(parts[1])
+    return total_us
+
+
+def local_import_ms():
+    # import time of our modules in a clean interpreter, without the one-off
+    # bytecode compile: the first run writes .pyc files to a scratch
+    # PYTHONPYCACHEPREFIX (even under PYTHONDONTWRITEBYTECODE), the rest
+    # read them. Best of a few runs filters scheduler noise.
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        _local_import_us(env)
+        return min(_local_import_us(env) for _ in range(LOCAL_IMPORT_RUNS)) / 1000
+
+
+# what a batch worker or the API imports; none of it may pull in Streamlit
+CORE_MODULES = ["resume_core.parse", "resume_core.generate", "resume_core.render"]
+
+
+def core_loads_streamlit():
+    proc = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, " + ", ".join(CORE_MODULES) + "; print('streamlit' in sys.modules)"],
+        capture_output=True, text=True, check=True
+    )
+    return proc.stdout.strip() == "True"
+
+
+def first_paint(app):
+    env = dict(os.environ)
+    env["RESUME_BUILDER_DB"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD, app, json.dumps(HEAVY_MODULES)],
+        capture_output=True, text=True, env=env
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["interpreter_to_first_paint_ms"] = wall_ms
+    return result
+
+
+def main(apps):
+    failures = []
+
+    local_ms = local_import_ms()
+    print(f"local modules import: {local_ms:.1f} ms (budget {LOCAL_IMPORT_BUDGET_MS} ms)")
+    if local_ms > LOCAL_IMPORT_BUDGET_MS:
+        failures.append(f"local modules take {local_ms:.1f} ms to import")
+    if core_loads_streamlit():
+        failures.append("resume_core imports streamlit")
+
+    for app in apps:
+        r = first_paint(app)
+        print(
+            f"{app}: interpreter → first paint {r['interpreter_to_first_paint_ms']:.0f} ms "
+            f"(streamlit import {r['streamlit_import_ms']:.0f} ms, "
+            f"first run {r['first_run_ms']:.0f} ms)"
+        )
+        if r["exceptions"]:
+            failures.append(f"{app} raised: {r['exceptions']}")
+        if r["loaded"]:
+            failures.append(f"{app} imported heavy modules on first paint: {r['loaded']}")
+        if r["interpreter_to_first_paint_ms"] > FIRST_PAINT_BUDGET_MS:
+            failures.append(f"{app} first paint over {FIRST_PAINT_BUDGET_MS} ms budget")
+
+    for f in failures:
+        print("FAIL:", f)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or APPS))
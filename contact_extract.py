@@ -0,0 +1,163 @@
+import os
+import re
+from collections import namedtuple
+
+# ---------------------------------------
+# CONTACT SCANNER CONFIG
+# ---------------------------------------
+HEADER_CHARS = 3000          # contact details live at the top of a resume
+DEFAULT_COUNTRY_CODE = os.environ.get("RESUME_DEFAULT_COUNTRY_CODE", "91")
+
+ContactEntity = namedtuple("ContactEntity", ["kind", "value", "start", "end"])
+
+# one pass, one compiled pattern; alternatives are tried left to right so an
+# e-mail is never mistaken for a URL and a URL path never for a phone number
+CONTACT_RE = re.compile(
+    r"""
+      (?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})
+    | (?P<url>
+          (?:https?://|www\.)[^\s<>()|,;"']+
+        | (?:[\w-]+\.)*(?:linkedin|github)\.com/[^\s<>()|,;"']+
+      )
+    | (?P<phone>(?<![\w+])(?:\+|00)?\d[\d ().-]{7,18}\d(?![\w@]))
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+SOCIAL_RE = re.compile(
+    r"(?:https?://)?(?:[\w-]+\.)*(?P<site>linkedin|github)\.com/(?P<path>[^\s?#]+)",
+    re.IGNORECASE,
+)
+
+# national numbering rules for a default country: digits written without a
+# +/00 prefix only get this country code when they match its rules
+NATIONAL_NUMBER_RES = {
+    "91": re.compile(r"0?[6-9]\d{9}"),                 # India: mobiles, trunk 0 optional
+    "1": re.compile(r"1?[2-9]\d{2}[2-9]\d{6}"),        # NANP
+    "44": re.compile(r"0[1-9]\d{8,9}"),                # UK, trunk 0
+    "61": re.compile(r"0[2-478]\d{8}"),                # Australia, trunk 0
+}
+
+NAME_LINE_RE = re.compile(r"^[A-Za-z][A-Za-z .'-]{1,60}$")
+# "Alex Doe | Engineer", "Alex Doe – Engineer": the name is the first part
+HEADER_SEPARATOR_RE = re.compile(r"\s*[|–—•]\s*")
+NOT_A_NAME = {"resume", "curriculum vitae", "cv", "bio data", "biodata", "profile"}
+
+
+# ---------------------------------------
+# NORMALIZERS
+# ---------------------------------------
+def normalize_phone(raw, country_code=DEFAULT_COUNTRY_CODE):
+    """Return the E.164 form (+<cc><number>), or "" unless the country is
+    certain: an explicit +/00 prefix, or a national number that matches
+    the default country's numbering rules."""
+    digits = re.sub(r"\D", "", raw)
+    raw = raw.strip()
+
+    if raw.startswith("+"):
+        e164 = digits
+    elif raw.startswith("00"):
+        e164 = digits[2:]
+    else:
+        rule = NATIONAL_NUMBER_RES.get(country_code)
+        if rule is None or not rule.fullmatch(digits):
+            return ""
+        national = digits.lstrip("0")
+        if country_code == "1" and len(national) == 11:
+            national = national[1:]
+        e164 = country_code + national
+
+    # E.164 allows at most 15 digits; below 10 it is a date range or an ID
+    if not 10 <= len(e164) <= 15:
+        return ""
+    return "+" + e164
+
+
+def phone_value(raw, country_code=DEFAULT_COUNTRY_CODE):
+    """What the scanner reports for a phone-like match: its E.164 form
+    when the country is certain, else its bare national digits; "" if it
+    doesn't look like a phone number (dates, IDs)."""
+    e164 = normalize_phone(raw, country_code)
+    if e164:
+        return e164
+    digits = re.sub(r"\D", "", raw)
+    # national numbers run 10-11 digits (with a trunk prefix)
+    if raw.strip().startswith(("+", "00")) or not 10 <= len(digits) <= 11:
+        return ""
+    return digits
+
+
+def national_number(phone, country_code=DEFAULT_COUNTRY_CODE):
+    # bare digits (country unknown) are already the national number
+    if not phone.startswith("+"):
+        return phone
+    digits = phone[1:]
+    if digits.startswith(country_code):
+        return digits[len(country_code):]
+    return digits
+
+
+def _name_candidate(text, limit):
+    offset = 0
+    for line in text[:limit].split("\n"):
+        stripped = line.strip()
+        if stripped:
+            candidate = HEADER_SEPARATOR_RE.split(stripped, 1)[0]
+            if NAME_LINE_RE.match(candidate) and candidate.lower() not in NOT_A_NAME \
+                    and len(candidate.split()) <= 5:
+                start = offset + line.index(candidate)
+                return ContactEntity("name", candidate, start, start + len(candidate))
+            # the name is one of the first few non-empty lines or not there at all
+            if offset > 400:
+                return None
+        offset += len(line) + 1
+    return None
+
+
+# ---------------------------------------
+# SCANNER
+# ---------------------------------------
+def scan_contacts(text, header_chars=HEADER_CHARS):
+    """Yield typed contact entities (email, phone, linkedin, github, url,
+    name) with their character positions. Only the header region is
+    scanned, and scanning stops as soon as every field has been seen.
+    Phone values are E.164 when the country is certain, else bare digits
+    (see phone_value)."""
+    wanted = {"name", "email", "phone", "linkedin", "github"}
+    limit = min(len(text), header_chars)
+
+    name = _name_candidate(text, limit)
+    if name:
+        wanted.discard("name")
+        yield name
+
+    for m in CONTACT_RE.finditer(text, 0, limit):
+        kind = m.lastgroup
+        value = m.group()
+        end = m.end()
+
+        if kind == "phone":
+            value = phone_value(value)
+            if not value:
+                continue
+        elif kind == "url":
+            # trailing sentence punctuation is not part of the link
+            value = value.rstrip(".")
+            end = m.start() + len(value)
+            social = SOCIAL_RE.match(value)
+            if social:
+                kind = social.group("site").lower()
+
+        wanted.discard(kind)
+        yield ContactEntity(kind, value, m.start(), end)
+
+        if not wanted:
+            return
+
+
+def extract_contacts(text, header_chars=HEADER_CHARS):
+    # first entity of each kind
+    found = {}
+    for entity in scan_contacts(text, header_chars):
+        found.setdefault(entity.kind, entity)
+    return found
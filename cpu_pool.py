@@ -0,0 +1,96 @@
+import os
+import threading
+
+# ---------------------------------------
+# SHARED PROCESS POOL FOR CPU-BOUND WORK
+# ---------------------------------------
+# pdfplumber layout analysis and python-docx rendering hold the GIL; run on
+# Streamlit's script threads they stall every other session on the server.
+# One pool per server process (r2 keeps it in st.cache_resource).
+# multiprocessing is imported when the first pool is built, not on import:
+# it costs ~30 ms and the landing page never needs it.
+CPU_WORKERS = int(os.environ.get("RESUME_CPU_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+MAX_QUEUED = int(os.environ.get("RESUME_CPU_MAX_QUEUED", str(2 * CPU_WORKERS)))
+QUEUE_TIMEOUT = 10.0        # seconds an interactive caller waits for a queue slot
+
+
+class PoolBusy(Exception):
+    """Raised when every worker is busy and the queue is full. Callers
+    should tell the user to retry rather than pile on more work."""
+
+
+class BoundedProcessPool:
+    """ProcessPoolExecutor with a cap on running + queued tasks, so a burst
+    of uploads is rejected instead of growing an unbounded backlog."""
+
+    def __init__(self, workers=CPU_WORKERS, max_queued=MAX_QUEUED):
+        self.workers = workers
+        self.max_queued = max_queued
+        self._slots = threading.BoundedSemaphore(workers + max_queued)
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self.completed = 0
+        self.rejected = 0
+
+    def _new_executor(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn, not fork: the Streamlit server is multi-threaded, and a
+        # forked child can inherit locks held by other threads
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _release(self, future):
+        self._slots.release()
+        with self._lock:
+            self.completed += 1
+
+    def submit(self, fn, *args, wait=QUEUE_TIMEOUT):
+        """Queue `fn(*args)` (both picklable); `wait=None` blocks until a
+        slot frees up, which suits background jobs."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        if not self._slots.acquire(timeout=wait):
+            with self._lock:
+                self.rejected += 1
+            raise PoolBusy(f"{self.workers} workers busy and {self.max_queued} tasks queued")
+
+        try:
+            with self._lock:
+                executor = self._executor
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM on a huge PDF): replace the pool once
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+                executor = self._executor
+            try:
+                future = executor.submit(fn, *args)
+            except BaseException:
+                self._slots.release()
+                raise
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    def run(self, fn, *args, wait=QUEUE_TIMEOUT):
+        return self.submit(fn, *args, wait=wait).result()
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            self._executor.shutdown(wait=False, cancel_futures=True)
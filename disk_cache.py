@@ -0,0 +1,99 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# ---------------------------------------
+# PERSISTENT KEY/VALUE CACHE (SQLITE)
+# ---------------------------------------
+# shares the database file with draft_store; values are stored as JSON
+DB_PATH = os.environ.get("RESUME_BUILDER_DB", "resume_builder.db")
+
+
+class DiskCache:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, namespace, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, namespace, keys):
+        keys = list(keys)
+        found = {}
+        # stay well under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM cache WHERE namespace = ? AND key IN ({marks})",
+                    (namespace, *chunk)
+                ).fetchall()
+            found.update((k, json.loads(v)) for k, v in rows)
+        return found
+
+    def put(self, namespace, key, value):
+        self.put_many(namespace, {key: value})
+
+    def put_many(self, namespace, items):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                [(namespace, k, json.dumps(v), now) for k, v in items.items()]
+            )
+
+    def update_many(self, namespace, keys, fn):
+        """Read-modify-write in one transaction: `fn({key: value})` gets the
+        stored values for `keys` and returns the {key: value} to write.
+        BEGIN IMMEDIATE takes SQLite's write lock up front, so concurrent
+        updaters (threads or other processes) can't lose each other's
+        writes."""
+        keys = list(keys)
+        marks = ",".join("?" * len(keys))
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                f"SELECT key, value FROM cache WHERE namespace = ? AND key IN ({marks})",
+                (namespace, *keys)
+            ).fetchall()
+            updates = fn({k: json.loads(v) for k, v in rows})
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                [(namespace, k, json.dumps(v), now) for k, v in updates.items()]
+            )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    # one connection per process, opened on first use
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DiskCache()
+        return _cache
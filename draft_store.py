@@ -0,0 +1,152 @@
+import atexit
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# ---------------------------------------
+# DRAFT PERSISTENCE (SQLITE, WRITE-BEHIND)
+# ---------------------------------------
+DB_PATH = os.environ.get("RESUME_BUILDER_DB", "resume_builder.db")
+FLUSH_INTERVAL = 0.5      # seconds between background flushes
+MAX_BATCH = 64            # flush early once this many drafts are pending
+LAST_SAVED_SIZE = 4096    # drafts whose last payload digest is remembered
+
+
+def new_draft_id():
+    return secrets.token_urlsafe(12)
+
+
+def _digest(payload):
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+class DraftStore:
+    """Saves are queued in memory and written in batches by one background
+    thread, so `save()` never touches the disk on the caller's thread."""
+
+    def __init__(self, path=DB_PATH, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending = {}
+        # draft id → digest of its last saved payload, LRU-bounded; a forgotten
+        # draft only costs one redundant write
+        self._last_saved = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        # one shared connection; sqlite calls are serialised by _db_lock
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS drafts ("
+                " draft_id TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+
+        self._worker = threading.Thread(
+            target=self._run, name="draft-store-writer", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    # ---------- PUBLIC API ----------
+    def save(self, draft_id, state):
+        payload = json.dumps(state, sort_keys=True, default=str)
+        digest = _digest(payload)
+
+        with self._lock:
+            # unchanged since the last save → nothing to write
+            if self._last_saved.get(draft_id) == digest:
+                self._last_saved.move_to_end(draft_id)
+                return
+            self._remember(draft_id, digest)
+            self._pending[draft_id] = payload
+            if len(self._pending) >= MAX_BATCH:
+                self._wake.set()
+
+    def load(self, draft_id):
+        with self._lock:
+            payload = self._pending.get(draft_id)
+
+        if payload is None:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM drafts WHERE draft_id = ?", (draft_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            payload = row[0]
+            with self._lock:
+                if draft_id not in self._last_saved:
+                    self._remember(draft_id, _digest(payload))
+
+        return json.loads(payload)
+
+    def delete(self, draft_id):
+        with self._lock:
+            self._pending.pop(draft_id, None)
+            self._last_saved.pop(draft_id, None)
+        with self._db_lock, self._conn:
+            self._conn.execute("DELETE FROM drafts WHERE draft_id = ?", (draft_id,))
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+
+        if not batch:
+            return
+
+        now = time.time()
+        try:
+            with self._db_lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO drafts (draft_id, payload, updated_at) VALUES (?, ?, ?)"
+                    " ON CONFLICT(draft_id) DO UPDATE SET"
+                    " payload = excluded.payload, updated_at = excluded.updated_at",
+                    [(k, v, now) for k, v in batch.items()]
+                )
+        except sqlite3.Error:
+            # put the batch back unless a newer save already replaced it
+            with self._lock:
+                for k, v in batch.items():
+                    self._pending.setdefault(k, v)
+            raise
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._worker.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+    # ---------- INTERNALS ----------
+    def _remember(self, draft_id, digest):
+        # caller holds self._lock
+        self._last_saved[draft_id] = digest
+        self._last_saved.move_to_end(draft_id)
+        while len(self._last_saved) > LAST_SAVED_SIZE:
+            self._last_saved.popitem(last=False)
+
+    # ---------- BACKGROUND WRITER ----------
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # keep the writer alive; the batch is retried next round
+                pass
@@ -0,0 +1,207 @@
+"""In-memory gazetteer of cities, states and countries.
+
+data/gazetteer.tsv is the editable source. `python gazetteer.py` compiles
+it into data/gazetteer.idx, a pickled array-form index that loads in about
+a millisecond; the snapshot is rebuilt automatically whenever the TSV's
+hash no longer matches.
+"""
+import os
+import re
+import sys
+from collections import namedtuple
+
+from snapshot import DATA_DIR, build_snapshot, load_snapshot
+
+SOURCE_PATH = os.path.join(DATA_DIR, "gazetteer.tsv")
+SNAPSHOT_PATH = os.path.join(DATA_DIR, "gazetteer.idx")
+SNAPSHOT_VERSION = 1
+
+HEADER_LINES = 15
+WORD, ACRONYM, ABBR = 0, 1, 2
+TOKEN_RE = re.compile(r"[^\W\d_]+(?:['’.-][^\W\d_]+)*\.?")
+
+# a place is only read from a line that looks like part of an address:
+# the contact line (e-mail, phone, link), a "Location:" label, or a line
+# that is nothing but places. "Worked at Phoenix Labs" is none of these.
+CONTACT_LINE_RE = re.compile(
+    r"@|\d[\d ().-]{6,}\d|https?://|www\.|linkedin|github", re.IGNORECASE
+)
+LOCATION_LABEL_RE = re.compile(
+    r"^\W*(?:current\s+)?(?:location|address|city|based\s+in|residence)\b", re.IGNORECASE
+)
+
+# certain: "City, Region", a labelled line or a places-only line; a bare
+# city on a contact line is a guess the LLM's answer should beat
+Location = namedtuple("Location", ["name", "certain"])
+NO_LOCATION = Location("", False)
+
+
+def tokenize(text):
+    return [t.rstrip(".") for t in TOKEN_RE.findall(text)]
+
+
+# ---------------------------------------
+# BUILD
+# ---------------------------------------
+def build_index(path=SOURCE_PATH):
+    """Array form: parallel lists for entries plus a first-token index.
+
+    index[first_token] → tuple of (rest_tokens, entry_id, mode), longest
+    phrase first. mode is WORD (case-insensitive), ACRONYM (USA, NYC: only
+    in capitals) or ABBR (two-letter codes like CA: capitals, after a city).
+    """
+    kinds, names, parent_names = [], [], []
+    phrases = []                    # (tokens, entry_id, mode)
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            cols = line.rstrip("\n").split("\t") + [""] * 5
+            kind, name, parent, aliases, abbrs = cols[:5]
+
+            entry_id = len(names)
+            kinds.append(kind)
+            names.append(name)
+            parent_names.append(parent)
+
+            for alias in [name] + [a for a in aliases.split("|") if a]:
+                if alias.isupper():
+                    mode = ABBR if len(alias) <= 2 else ACRONYM
+                    phrases.append((tuple(tokenize(alias)), entry_id, mode))
+                else:
+                    phrases.append((tuple(tokenize(alias.lower())), entry_id, WORD))
+            for abbr in [a for a in abbrs.split("|") if a]:
+                phrases.append(((abbr,), entry_id, ABBR))
+
+    name_to_id = {}
+    for i, name in enumerate(names):
+        # a city and a state may share a name (Delhi); prefer the broader one
+        if name not in name_to_id or kinds[i] != "city":
+            name_to_id[name] = i
+    parents = [name_to_id.get(p, -1) for p in parent_names]
+
+    index = {}
+    for tokens, entry_id, mode in sorted(phrases, key=lambda p: -len(p[0])):
+        index.setdefault(tokens[0], []).append((tokens[1:], entry_id, mode))
+
+    return {
+        "kinds": kinds,
+        "names": names,
+        "parents": parents,
+        "index": {k: tuple(v) for k, v in index.items()},
+    }
+
+
+_index = None
+
+
+def get_index():
+    global _index
+    if _index is None:
+        _index = load_snapshot(SOURCE_PATH, SNAPSHOT_PATH, SNAPSHOT_VERSION, build_index)
+    return _index
+
+
+# ---------------------------------------
+# LOOKUP
+# ---------------------------------------
+def scan(text):
+    """Yield (token_position, token_count, entry_id, mode) for every
+    gazetteer phrase in `text`: one linear pass over the tokens, taking the
+    longest exact match at each position."""
+    idx = get_index()["index"]
+    raw = tokenize(text)
+    lower = [t.lower() for t in raw]
+
+    i = 0
+    while i < len(raw):
+        hit = None
+        # lower-case key → WORD phrases; as-written key → ACRONYM/ABBR phrases
+        for key, tokens in ((lower[i], lower), (raw[i], raw)):
+            for rest, entry_id, mode in idx.get(key, ()):
+                if (mode == WORD) != (tokens is lower):
+                    continue
+                n = len(rest)
+                if tuple(tokens[i + 1:i + 1 + n]) == rest:
+                    if hit is None or n + 1 > hit[1]:
+                        hit = (i, n + 1, entry_id, mode)
+                    break
+        if hit:
+            yield hit
+            i += hit[1]
+        else:
+            i += 1
+
+
+def _ancestors(entry_id):
+    parents = get_index()["parents"]
+    seen = []
+    p = parents[entry_id]
+    while p != -1 and p not in seen:
+        seen.append(p)
+        p = parents[p]
+    return seen
+
+
+def _city_label(entry_id, hits, n):
+    # "City, Region"; returns (label, region confirmed by the next hit)
+    idx = get_index()
+    names = idx["names"]
+    pos, length, _, _ = hits[n]
+    ancestors = _ancestors(entry_id)
+    region = ancestors[0] if ancestors else -1
+
+    # "Austin, TX" / "Pune, Maharashtra": trust what follows the city
+    follower = hits[n + 1] if n + 1 < len(hits) else None
+    confirmed = bool(follower and follower[0] == pos + length and follower[2] in ancestors)
+    if confirmed:
+        region = follower[2]
+
+    if region == -1 or names[region] == names[entry_id]:
+        return names[entry_id], confirmed
+    return f"{names[entry_id]}, {names[region]}", confirmed
+
+
+def find_location(text, max_lines=HEADER_LINES, skip=()):
+    """Best Location ("City, State", or a state / country on its own) in
+    the first `max_lines` non-empty lines, read only from address-like
+    lines (see CONTACT_LINE_RE). Lines in `skip` (e.g. the candidate's
+    name) are ignored."""
+    idx = get_index()
+    kinds, names = idx["kinds"], idx["names"]
+    skip = {s.strip().lower() for s in skip if s}
+
+    guess = fallback = NO_LOCATION
+    lines = [l for l in text.splitlines() if l.strip()][:max_lines]
+    for line in lines:
+        if line.strip().lower() in skip:
+            continue
+
+        hits = list(scan(line))
+        if not hits:
+            continue
+        places_only = sum(h[1] for h in hits) == len(tokenize(line))
+        labelled = bool(LOCATION_LABEL_RE.match(line))
+        contact = bool(CONTACT_LINE_RE.search(line))
+
+        for n, (pos, length, entry_id, mode) in enumerate(hits):
+            if kinds[entry_id] == "city":
+                label, confirmed = _city_label(entry_id, hits, n)
+                if confirmed or places_only or labelled:
+                    return Location(label, True)
+                if contact and not guess.name:
+                    guess = Location(label, False)
+                continue
+
+            # two-letter codes (CA, UP) are only meaningful right after a city
+            if mode != ABBR and not fallback.name and (places_only or labelled or contact):
+                fallback = Location(names[entry_id], places_only or labelled)
+
+    return guess if guess.name else fallback
+
+
+if __name__ == "__main__":
+    data = build_snapshot(SOURCE_PATH, SNAPSHOT_PATH, SNAPSHOT_VERSION, build_index)
+    print(f"wrote {SNAPSHOT_PATH}: {len(data['names'])} places, "
+          f"{sum(len(v) for v in data['index'].values())} phrases", file=sys.stderr)
@@ -0,0 +1,211 @@
+"""Resume ↔ job-description match scoring, fully local (no LLM).
+
+The resume is split into sections and the JD into paragraphs; both become
+rows of one term-count matrix, so TF-IDF similarity, BM25 section
+relevance and keyword coverage are a handful of numpy operations.
+"""
+import re
+import time
+from collections import namedtuple
+
+import numpy as np
+
+import skills_taxonomy
+
+# ---------------------------------------
+# MATCH CONFIG
+# ---------------------------------------
+TOP_KEYWORDS = 20
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# share of the final score; skill weight moves to the others when the JD
+# names no known skill
+SCORE_WEIGHTS = {"skills": 0.5, "keywords": 0.25, "similarity": 0.25}
+
+SKILL_CATEGORIES = skills_taxonomy.TECH_CATEGORIES + (skills_taxonomy.SOFT,)
+
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "objective",
+                "career objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience",
+                   "employment", "work history", "internship", "internships"],
+    "projects": ["projects", "academic projects", "personal projects", "key projects"],
+    "skills": ["skills", "technical skills", "key skills", "soft skills",
+               "core competencies", "technologies", "tools"],
+    "education": ["education", "academic background", "qualifications"],
+    "certifications": ["certifications", "certificates", "courses", "training"],
+    "achievements": ["achievements", "awards", "accomplishments"],
+    "languages": ["languages", "languages known"],
+    "declaration": ["declaration"],
+}
+
+_HEADING_OF = {alias: name for name, aliases in SECTION_HEADINGS.items() for alias in aliases}
+HEADING_RE = re.compile(
+    r"^\W*(" + "|".join(sorted(map(re.escape, _HEADING_OF), key=len, reverse=True)) + r")\W*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+PARAGRAPH_RE = re.compile(r"\n\s*\n|\n(?=\s*[-•*])")
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and any are as at be
+because been before being below between both but by can could did do does
+doing done down during each either etc few for from further get had has have
+having he her here hers hiring him his how i if in into is it its itself just least
+like made make many may me more most must my no nor not of off on once one only
+or other our ours out over own per plus role same she should so some such than
+that the their them then there these they this those through to too under
+until up upon us use used using very via was we well were what when where
+which while who whom why will with within without would you your yours
+ability able candidate candidates company experience good great job join
+looking knowledge new nice preferred required requirements responsibilities
+responsible skills strong team work working year years including etc
+""".split())
+
+SectionCoverage = namedtuple(
+    "SectionCoverage", ["name", "coverage", "relevance", "matched_keywords"]
+)
+MatchResult = namedtuple(
+    "MatchResult",
+    ["score", "similarity", "skill_coverage", "keyword_coverage",
+     "matched_skills", "missing_skills", "keywords", "sections", "elapsed_ms"],
+)
+
+
+# ---------------------------------------
+# TEXT → TERMS
+# ---------------------------------------
+def split_sections(resume_text):
+    """[(section_name, text)] in document order; text before the first
+    recognised heading is the "header" section."""
+    sections = []
+    name, start = "header", 0
+    for m in HEADING_RE.finditer(resume_text):
+        sections.append((name, resume_text[start:m.start()]))
+        name, start = _HEADING_OF[m.group(1).lower()], m.end()
+    sections.append((name, resume_text[start:]))
+
+    merged = {}
+    for name, text in sections:
+        if text.strip():
+            merged[name] = merged.get(name, "") + text + "\n"
+    return list(merged.items())
+
+
+def terms(text):
+    """Content words, with every skill mention replaced by its canonical
+    name, so "js" in the JD and "JavaScript" in the resume are one term."""
+    tokens = skills_taxonomy.tokenize(text)
+    skills = {
+        pos: (length, name.lower())
+        for pos, length, name, cat in skills_taxonomy.scan(tokens)
+        if cat in SKILL_CATEGORIES
+    }
+
+    words = []
+    i = 0
+    while i < len(tokens):
+        if i in skills:
+            length, name = skills[i]
+            words.append(name)
+            i += length
+            continue
+        word = tokens[i].lower().rstrip(".")
+        if len(word) > 1 and not word[0].isdigit() and word not in STOPWORDS:
+            words.append(word)
+        i += 1
+    return words
+
+
+def _count_matrix(docs):
+    # docs: list of term lists → (counts[D, V], vocabulary list)
+    vocab = {}
+    ids = [np.fromiter((vocab.setdefault(t, len(vocab)) for t in doc), dtype=np.int64)
+           for doc in docs]
+    counts = np.zeros((len(docs), len(vocab)), dtype=np.float64)
+    for row, doc_ids in enumerate(ids):
+        if doc_ids.size:
+            counts[row] = np.bincount(doc_ids, minlength=len(vocab))
+    return counts, list(vocab)
+
+
+def _bm25(counts, query):
+    # rows of `counts` are the documents, `query` is a term-count vector
+    n_docs = counts.shape[0]
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+    lengths = counts.sum(axis=1, keepdims=True)
+    avg = lengths.mean() or 1.0
+    tf = counts * (BM25_K1 + 1) / (counts + BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg))
+    return tf @ (idf * np.minimum(query, 1))
+
+
+# ---------------------------------------
+# PUBLIC API
+# ---------------------------------------
+def match_resume(resume_text, jd_text, resume_skills=()):
+    """Score a resume against a job description. `resume_skills` (e.g. the
+    builder's skills_list) is merged with skills found in the text."""
+    started = time.perf_counter()
+
+    sections = split_sections(resume_text)
+    paragraphs = [p for p in PARAGRAPH_RE.split(jd_text) if p.strip()] or [jd_text]
+    docs = [terms(text) for _, text in sections] + [terms(p) for p in paragraphs]
+    counts, vocab = _count_matrix(docs)
+
+    n_sections = len(sections)
+    resume_counts = counts[:n_sections]
+    resume_vec = resume_counts.sum(axis=0)
+    jd_vec = counts[n_sections:].sum(axis=0)
+
+    # TF-IDF (smoothed idf over sections + JD paragraphs), cosine similarity
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + counts.shape[0]) / (1 + df)) + 1
+    a, b = resume_vec * idf, jd_vec * idf
+    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    similarity = float(a @ b / norm) if norm else 0.0
+
+    # the JD's most distinctive terms are the keywords to cover
+    jd_weights = jd_vec * idf
+    top = np.argsort(-jd_weights, kind="stable")[:TOP_KEYWORDS]
+    top = top[jd_weights[top] > 0]
+    keywords = [vocab[i] for i in top]
+    keyword_coverage = float(np.count_nonzero(resume_vec[top])) / len(top) if top.size else 0.0
+
+    relevance = _bm25(resume_counts, jd_vec) if n_sections else np.zeros(0)
+    best = relevance.max() if relevance.size and relevance.max() > 0 else 1.0
+    section_rows = []
+    for row, (name, _) in enumerate(sections):
+        hits = top[resume_counts[row, top] > 0]
+        section_rows.append(SectionCoverage(
+            name,
+            hits.size / top.size if top.size else 0.0,
+            float(relevance[row] / best),
+            [vocab[i] for i in hits],
+        ))
+
+    jd_skills = skills_taxonomy.extract_skills(jd_text, SKILL_CATEGORIES)
+    have = {s.lower() for s in skills_taxonomy.extract_skills(resume_text, SKILL_CATEGORIES)}
+    have.update(s.lower() for s in skills_taxonomy.normalize_skills(resume_skills))
+    matched = [s for s in jd_skills if s.lower() in have]
+    missing = [s for s in jd_skills if s.lower() not in have]
+    skill_coverage = len(matched) / len(jd_skills) if jd_skills else 0.0
+
+    weights = dict(SCORE_WEIGHTS)
+    if not jd_skills:
+        share = weights.pop("skills") / len(weights)
+        weights = {k: w + share for k, w in weights.items()}
+    parts = {"skills": skill_coverage, "keywords": keyword_coverage, "similarity": similarity}
+    score = round(100 * sum(w * parts[k] for k, w in weights.items()))
+
+    return MatchResult(
+        score=score,
+        similarity=similarity,
+        skill_coverage=skill_coverage,
+        keyword_coverage=keyword_coverage,
+        matched_skills=matched,
+        missing_skills=missing,
+        keywords=keywords,
+        sections=section_rows,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
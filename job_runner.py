@@ -0,0 +1,141 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+# ---------------------------------------
+# BACKGROUND JOBS (THREAD POOL + SQLITE JOB TABLE)
+# ---------------------------------------
+# shares the database file with draft_store / disk_cache. A job outlives the
+# Streamlit rerun (and the browser tab) that submitted it; its row holds the
+# stage, the partial results so far and finally the result or error.
+DB_PATH = os.environ.get("RESUME_BUILDER_DB", "resume_builder.db")
+JOB_WORKERS = int(os.environ.get("RESUME_JOB_WORKERS", "4"))
+JOB_TTL = 24 * 3600           # finished jobs older than this are pruned
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED = (DONE, FAILED)
+
+Job = namedtuple(
+    "Job",
+    "job_id kind status stage progress partial result error created_at updated_at"
+)
+
+
+def new_job_id():
+    return secrets.token_urlsafe(12)
+
+
+class JobProgress:
+    """Handed to the job function: `stage()` moves the progress bar,
+    `partial()` publishes fields the UI may show before the job is done."""
+
+    def __init__(self, runner, job_id):
+        self.runner = runner
+        self.job_id = job_id
+        self.partial_results = {}
+
+    def stage(self, name, progress):
+        self.runner._update(self.job_id, stage=name, progress=progress)
+
+    def partial(self, fields):
+        if not fields:
+            return
+        self.partial_results.update(fields)
+        self.runner._update(
+            self.job_id, partial=json.dumps(self.partial_results, default=str)
+        )
+
+
+class JobRunner:
+    def __init__(self, path=DB_PATH, max_workers=JOB_WORKERS):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " job_id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " stage TEXT NOT NULL,"
+                " progress REAL NOT NULL,"
+                " partial TEXT NOT NULL,"
+                " result TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            # a previous server process died mid-job: those threads are gone
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ?"
+                " WHERE status IN (?, ?)",
+                (FAILED, "interrupted by a server restart", time.time(), QUEUED, RUNNING)
+            )
+            self._conn.execute(
+                "DELETE FROM jobs WHERE updated_at < ?", (time.time() - JOB_TTL,)
+            )
+
+        # imported here: the landing page never builds a runner
+        from concurrent.futures import ThreadPoolExecutor
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    # ---------- PUBLIC API ----------
+    def submit(self, kind, fn, *args):
+        """Run `fn(progress, *args)` on the pool; returns the job id at once.
+        The return value must be JSON-serialisable."""
+        job_id = new_job_id()
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, status, stage, progress, partial,"
+                " created_at, updated_at) VALUES (?, ?, ?, ?, 0, '{}', ?, ?)",
+                (job_id, kind, QUEUED, QUEUED, now, now)
+            )
+        self._pool.submit(self._run, job_id, fn, args)
+        return job_id
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, kind, status, stage, progress, partial, result, error,"
+                " created_at, updated_at FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        row = list(row)
+        row[5] = json.loads(row[5])
+        row[6] = json.loads(row[6]) if row[6] is not None else None
+        return Job(*row)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- INTERNALS ----------
+    def _update(self, job_id, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns} WHERE job_id = ?", (*fields.values(), job_id)
+            )
+
+    def _run(self, job_id, fn, args):
+        self._update(job_id, status=RUNNING, stage="started")
+        try:
+            result = fn(JobProgress(self, job_id), *args)
+            self._update(
+                job_id, status=DONE, stage=DONE, progress=1.0,
+                result=json.dumps(result, default=str)
+            )
+        except Exception as e:
+            self._update(job_id, status=FAILED, error=f"{type(e).__name__}: {e}")
+
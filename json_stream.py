@@ -0,0 +1,93 @@
+import json
+
+# ---------------------------------------
+# INCREMENTAL JSON OBJECT PARSER
+# ---------------------------------------
+class ObjectStream:
+    """Feed a JSON object in arbitrary chunks; feed() returns the top-level
+    (key, value) members completed by that chunk, in order.
+
+    Only the structure is tracked while scanning (nesting depth, strings,
+    escapes); each member's text is handed to json.loads once its closing
+    ',' or '}' arrives, so every character is scanned exactly once. Only
+    the chunks of the member still open are kept.
+    """
+
+    def __init__(self):
+        self._chunks = []       # unconsumed text, from offset _base on
+        self._base = 0
+        self.pos = 0            # offsets below are into the whole reply
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.expect_key = False
+        self.key_start = None
+        self.key = None
+        self.value_start = None
+        self.done = False
+
+    def feed(self, chunk):
+        self._chunks.append(chunk)
+        members = []
+
+        for i, c in enumerate(chunk, self.pos):
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif c == "\\":
+                    self.escape = True
+                elif c == '"':
+                    self.in_string = False
+                    if self.key_start is not None:
+                        self.key = json.loads(self._slice(self.key_start, i + 1))
+                        self.key_start = None
+                continue
+
+            if c == '"':
+                self.in_string = True
+                if self.depth == 1 and self.expect_key:
+                    self.key_start = i
+                    self.expect_key = False
+            elif c in "{[":
+                self.depth += 1
+                if self.depth == 1:
+                    self.expect_key = True
+            elif c in "}]":
+                if self.depth == 1:
+                    self._close_member(i, members)
+                    self.done = True
+                self.depth -= 1
+            elif self.depth == 1:
+                if c == ":":
+                    self.value_start = i + 1
+                elif c == ",":
+                    self._close_member(i, members)
+                    self.expect_key = True
+
+        self.pos += len(chunk)
+        self._trim()
+        return members
+
+    def _slice(self, start, end):
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0][start - self._base:end - self._base]
+
+    def _trim(self):
+        # drop whole chunks that end before the open key/value starts
+        starts = [s for s in (self.key_start, self.value_start) if s is not None]
+        keep = min(starts, default=self.pos)
+        while self._chunks and self._base + len(self._chunks[0]) <= keep:
+            self._base += len(self._chunks.pop(0))
+
+    def _close_member(self, end, members):
+        if self.key is None or self.value_start is None:
+            return
+        raw = self._slice(self.value_start, end).strip()
+        try:
+            members.append((self.key, json.loads(raw)))
+        except ValueError:
+            pass            # malformed member: left for the whole-reply parse
+        self.key = None
+        self.value_start = None
@@ -0,0 +1,280 @@
+import hashlib
+import itertools
+import json
+import threading
+from collections import OrderedDict
+
+# ollama/httpx/requests are imported on first call, not at app start
+
+from llm_resilience import CircuitBreaker, LLMUnavailable, call_with_retry
+from llm_scheduler import SchedulerBusy, current_priority, scheduler
+
+# the one local model every feature (UI, API, batch) talks to
+MODEL_NAME = "llama3.2:latest"
+
+# ---------------------------------------
+# SINGLE-FLIGHT COALESCING
+# ---------------------------------------
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one execution: the first
+    caller runs it, everyone else waits and receives the same result (or
+    exception)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self.executed,
+                "shared": self.shared,
+            }
+
+
+_flight = SingleFlight()
+
+
+def request_key(*parts):
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def flight_stats():
+    return _flight.stats()
+
+
+def metrics():
+    return {
+        "single_flight": _flight.stats(),
+        "scheduler": scheduler.metrics(),
+        "circuit_breaker": _breaker.metrics(),
+    }
+
+
+# ---------------------------------------
+# TIMEOUTS, RETRIES, CIRCUIT BREAKER
+# ---------------------------------------
+LAST_GOOD_SIZE = 512
+
+_breaker = CircuitBreaker()
+_last_good = OrderedDict()      # request key → last successful response
+_last_good_lock = threading.Lock()
+
+# one ollama.Client (and its connection pool) per whole-second timeout,
+# created on first use and kept for the life of the process
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _client(timeout):
+    import ollama
+
+    # floor, so a retry never waits past call_with_retry's budget; at most
+    # CALL_TIMEOUT distinct clients
+    timeout = max(1, int(timeout))
+    with _clients_lock:
+        client = _clients.get(timeout)
+        if client is None:
+            client = _clients[timeout] = ollama.Client(timeout=timeout)
+        return client
+
+
+def _stale_ok(options):
+    # only a deterministic (temperature 0) reply may be answered from the
+    # last-good cache: a sampled one is asked for to get a *new* answer, and
+    # best-of-N would otherwise rank identical copies. Ollama samples unless
+    # told otherwise
+    return (options.get("options") or {}).get("temperature") == 0
+
+
+def _is_retryable(e):
+    import httpx
+    import ollama
+    import requests
+
+    if isinstance(e, ollama.ResponseError):
+        return e.status_code >= 500 or e.status_code == 429
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return e.response.status_code >= 500 or e.response.status_code == 429
+    # connection refused/reset, read timeouts (requests errors are OSErrors)
+    return isinstance(e, (OSError, httpx.HTTPError))
+
+
+def _serve_stale(key, reason, stale_ok=True):
+    if stale_ok:
+        with _last_good_lock:
+            if key in _last_good:
+                return _last_good[key]
+    raise LLMUnavailable(reason)
+
+
+def _remember(key, result):
+    with _last_good_lock:
+        _last_good[key] = result
+        _last_good.move_to_end(key)
+        while len(_last_good) > LAST_GOOD_SIZE:
+            _last_good.popitem(last=False)
+
+
+def _resilient(key, fn, priority, stale_ok=True):
+    # breaker open → answer immediately from cache, or let the caller fall back
+    if not _breaker.allow():
+        return _serve_stale(key, "LLM circuit breaker is open", stale_ok)
+
+    def attempt(timeout):
+        with scheduler.slot(priority):
+            return fn(timeout)
+
+    try:
+        result = call_with_retry(attempt, _is_retryable)
+    except SchedulerBusy:
+        _breaker.release_trial()
+        raise
+    except LLMUnavailable as e:
+        _breaker.record_failure()
+        return _serve_stale(key, str(e), stale_ok)
+    except Exception:
+        _breaker.record_failure()
+        raise
+
+    _breaker.record_success()
+    if stale_ok:
+        _remember(key, result)
+    return result
+
+
+# ---------------------------------------
+# LLM CALLS
+# ---------------------------------------
+def chat(model, messages, priority=None, **options):
+    # identical model + messages + options → one Ollama call, fanned out;
+    # only the leader takes a scheduler slot. priority=None → the caller's
+    # llm_scheduler.priority_scope (INTERACTIVE outside one).
+    # Raises LLMUnavailable when no answer (fresh or, for temperature 0,
+    # cached) can be given.
+    priority = current_priority() if priority is None else priority
+    key = request_key("chat", model, messages, options)
+    stale_ok = _stale_ok(options)
+
+    def call(timeout):
+        return _client(timeout).chat(model=model, messages=messages, **options)
+
+    return _flight.do(key, lambda: _resilient(key, call, priority, stale_ok))
+
+
+def chat_stream(model, messages, priority=None, **options):
+    """Yield the reply's text as it arrives. Shares chat()'s breaker and
+    last-good cache, but not single-flight. Only opening the stream is
+    retried: a half-received reply can't be replayed."""
+    priority = current_priority() if priority is None else priority
+    key = request_key("chat", model, messages, options)
+    stale_ok = _stale_ok(options)
+
+    if not _breaker.allow():
+        reply = _serve_stale(key, "LLM circuit breaker is open", stale_ok)
+        yield reply["message"]["content"]
+        return
+
+    def open_stream(timeout):
+        stream = _client(timeout).chat(
+            model=model, messages=messages, stream=True, **options
+        )
+        # the request is sent on the first read, so connection errors surface
+        # here, inside the retry loop
+        return next(stream, None), stream
+
+    pieces = []
+    stream = None
+    try:
+        with scheduler.slot(priority):
+            try:
+                first, stream = call_with_retry(open_stream, _is_retryable)
+                for chunk in itertools.chain([first] if first else [], stream):
+                    piece = chunk["message"]["content"]
+                    pieces.append(piece)
+                    yield piece
+            finally:
+                # a caller that stops reading early drops the connection
+                # here, before the slot is given back
+                if stream is not None:
+                    stream.close()
+    except (SchedulerBusy, GeneratorExit):
+        # never reached the LLM, or the caller stopped reading: says nothing
+        # about the LLM's health
+        _breaker.release_trial()
+        raise
+    except LLMUnavailable as e:
+        _breaker.record_failure()
+        yield _serve_stale(key, str(e), stale_ok)["message"]["content"]
+        return
+    except Exception:
+        _breaker.record_failure()
+        raise
+
+    _breaker.record_success()
+    if stale_ok:
+        _remember(key, {"message": {"role": "assistant", "content": "".join(pieces)}})
+
+
+def generate(url, model, prompt, priority=None):
+    # raw /api/generate call used by the interview app; its prompts are
+    # fixed per skill/answer, so a cached reply is served when Ollama is down
+    priority = current_priority() if priority is None else priority
+    key = request_key("generate", url, model, prompt)
+
+    def call(timeout):
+        import requests
+
+        response = requests.post(
+            url,
+            json={
+                "model": model,
+                "prompt": prompt,
+                "stream": False
+            },
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    return _flight.do(key, lambda: _resilient(key, call, priority))
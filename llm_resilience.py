@@ -0,0 +1,121 @@
+import os
+import random
+import threading
+import time
+
+# ---------------------------------------
+# RESILIENCE CONFIG
+# ---------------------------------------
+CALL_TIMEOUT = float(os.environ.get("LLM_CALL_TIMEOUT", "60"))        # per attempt
+REQUEST_BUDGET = float(os.environ.get("LLM_REQUEST_BUDGET", "120"))   # all attempts
+MAX_ATTEMPTS = int(os.environ.get("LLM_MAX_ATTEMPTS", "3"))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+BREAKER_THRESHOLD = int(os.environ.get("LLM_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.environ.get("LLM_BREAKER_RESET", "30"))
+
+
+class LLMUnavailable(Exception):
+    """The LLM could not produce an answer within the request budget, or
+    the circuit breaker is open. Callers should use a fallback."""
+
+
+# ---------------------------------------
+# CIRCUIT BREAKER
+# ---------------------------------------
+class CircuitBreaker:
+    """closed → open after `threshold` consecutive failures; after
+    `reset_timeout` one trial call is let through (half-open) and its
+    outcome closes or re-opens the circuit."""
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self.trips = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.threshold:
+                if self._opened_at is None:
+                    self.trips += 1
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release_trial(self):
+        # the trial call never reached the LLM; let another caller try
+        with self._lock:
+            self._trial_running = False
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "state": self._state(),
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+            }
+
+
+# ---------------------------------------
+# RETRIES WITH JITTERED BACKOFF
+# ---------------------------------------
+def call_with_retry(fn, is_retryable, budget=REQUEST_BUDGET,
+                    attempts=MAX_ATTEMPTS, call_timeout=CALL_TIMEOUT):
+    """Run `fn(timeout)` until it succeeds, a non-retryable error is raised,
+    the attempts run out or the time budget is spent. Each attempt gets the
+    smaller of `call_timeout` and whatever budget is left."""
+    deadline = time.monotonic() + budget
+    last_error = None
+
+    for attempt in range(attempts):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        try:
+            return fn(min(call_timeout, remaining))
+        except Exception as e:
+            if not is_retryable(e):
+                raise
+            last_error = e
+
+        # full jitter; never sleep past the budget
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+        if attempt + 1 >= attempts or time.monotonic() + delay >= deadline:
+            break
+        time.sleep(delay)
+
+    raise LLMUnavailable(f"LLM call failed after retries: {last_error}") from last_error
@@ -0,0 +1,177 @@
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# ---------------------------------------
+# PRIORITY CLASSES
+# ---------------------------------------
+INTERACTIVE = 0   # a user is waiting on this call (wizard steps, interview)
+PREFETCH = 1      # speculative work the user may need soon
+BATCH = 2         # bulk jobs; only runs when nobody else is waiting
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", PREFETCH: "prefetch", BATCH: "batch"}
+
+# match Ollama's own parallelism so requests queue here, not inside Ollama
+MAX_CONCURRENCY = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
+
+# per class: (max queued requests, max seconds a request may wait for a slot)
+ADMISSION_LIMITS = {
+    INTERACTIVE: (32, 90.0),
+    PREFETCH: (8, 5.0),
+    BATCH: (256, 900.0),
+}
+
+
+# ---------------------------------------
+# DEFAULT PRIORITY FOR A UNIT OF WORK
+# ---------------------------------------
+# callers that can't pass a priority through every generator (the HTTP API,
+# background jobs) set one for the calls made on the current thread
+_default_priority = contextvars.ContextVar("llm_priority", default=INTERACTIVE)
+
+
+def current_priority():
+    return _default_priority.get()
+
+
+@contextmanager
+def priority_scope(priority):
+    token = _default_priority.set(priority)
+    try:
+        yield
+    finally:
+        _default_priority.reset(token)
+
+
+class SchedulerBusy(Exception):
+    """Raised when a request is rejected by admission control or gives up
+    waiting for a slot. Callers should fail fast or degrade."""
+
+
+class _Stats:
+    def __init__(self):
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent_waits = deque(maxlen=256)
+
+    def record_wait(self, seconds):
+        self.admitted += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self.recent_waits.append(seconds)
+
+    def as_dict(self):
+        waits = sorted(self.recent_waits)
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_avg_s": self.wait_total / self.admitted if self.admitted else 0.0,
+            "wait_p95_s": p95,
+            "wait_max_s": self.wait_max,
+        }
+
+
+class Scheduler:
+    def __init__(self, concurrency=MAX_CONCURRENCY, limits=ADMISSION_LIMITS):
+        self.concurrency = max(1, concurrency)
+        self.limits = limits
+        self._cond = threading.Condition()
+        self._active = 0
+        self._queue = []                    # heap of (priority, seq)
+        self._depth = {p: 0 for p in PRIORITY_NAMES}
+        self._seq = itertools.count()
+        self._stats = {p: _Stats() for p in PRIORITY_NAMES}
+        self._service_avg = 0.0             # EWMA of slot hold time
+
+    @contextmanager
+    def slot(self, priority=INTERACTIVE):
+        self._acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    def _estimated_wait(self, priority=BATCH):
+        # requests of equal or higher priority, queued or running, go first
+        ahead = sum(n for p, n in self._depth.items() if p <= priority)
+        backlog = ahead + self._active - self.concurrency + 1
+        return max(0, backlog) * self._service_avg / self.concurrency
+
+    def _acquire(self, priority):
+        max_depth, max_wait = self.limits[priority]
+        stats = self._stats[priority]
+        enqueued = time.monotonic()
+
+        with self._cond:
+            if self._active < self.concurrency and not self._queue:
+                self._active += 1
+                stats.record_wait(0.0)
+                return
+
+            # backpressure: reject up front instead of piling up
+            if self._depth[priority] >= max_depth or self._estimated_wait(priority) > max_wait:
+                stats.rejected += 1
+                raise SchedulerBusy(
+                    f"LLM queue full for {PRIORITY_NAMES[priority]} requests"
+                )
+
+            ticket = (priority, next(self._seq))
+            heapq.heappush(self._queue, ticket)
+            self._depth[priority] += 1
+            deadline = enqueued + max_wait
+
+            try:
+                while not (self._queue[0] == ticket and self._active < self.concurrency):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._queue.remove(ticket)
+                        heapq.heapify(self._queue)
+                        stats.timed_out += 1
+                        raise SchedulerBusy(
+                            f"Timed out waiting for an LLM slot after {max_wait:.0f}s"
+                        )
+                    self._cond.wait(remaining)
+
+                heapq.heappop(self._queue)
+                self._active += 1
+                stats.record_wait(time.monotonic() - enqueued)
+            finally:
+                self._depth[priority] -= 1
+                self._cond.notify_all()
+
+    def _release(self, held):
+        with self._cond:
+            self._active -= 1
+            self._service_avg = held if not self._service_avg else (
+                0.8 * self._service_avg + 0.2 * held
+            )
+            self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "active": self._active,
+                "queue_depth": {
+                    PRIORITY_NAMES[p]: n for p, n in self._depth.items()
+                },
+                "service_avg_s": self._service_avg,
+                "estimated_wait_s": self._estimated_wait(),
+                "classes": {
+                    PRIORITY_NAMES[p]: s.as_dict() for p, s in self._stats.items()
+                },
+            }
+
+
+scheduler = Scheduler()
@@ -0,0 +1,207 @@
+"""Near-duplicate resumes: MinHash signatures + LSH banding.
+
+Signatures and band buckets live in the shared disk cache, so a resume
+seen in an earlier session (or by another worker) is still found. A new
+upload that is a near-duplicate of an already parsed resume reuses that
+parse and only sends its changed sections to the LLM.
+"""
+import hashlib
+import os
+import re
+import zlib
+
+import numpy as np
+
+from disk_cache import get_cache
+from jd_match import split_sections
+
+# ---------------------------------------
+# MINHASH / LSH CONFIG
+# ---------------------------------------
+NUM_PERM = 128
+BANDS = 16                  # 16 bands × 8 rows: ~95% of pairs at Jaccard 0.8 collide
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 5
+MAX_BUCKET = 64             # template clones must not grow a bucket forever
+NEAR_DUP_THRESHOLD = float(os.environ.get("RESUME_NEAR_DUP_THRESHOLD", "0.8"))
+
+SIG_NAMESPACE = f"minhash:{NUM_PERM}"
+LSH_NAMESPACE = f"lsh:{BANDS}x{ROWS}"
+PARSE_NAMESPACE = "ats_parse"
+
+WORD_RE = re.compile(r"\w+")
+
+# fixed seed: signatures are persisted and must stay comparable
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+
+
+# ---------------------------------------
+# SIGNATURES
+# ---------------------------------------
+def shingles(text):
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def minhash(text):
+    """uint32[NUM_PERM] signature, or None for empty text. Each permutation
+    is a multiply-shift hash of the shingle's CRC32, all in one numpy op."""
+    sh = shingles(text)
+    if not sh:
+        return None
+    x = np.fromiter((zlib.crc32(s.encode()) for s in sh), dtype=np.uint64, count=len(sh))
+    # uint64 arithmetic wraps mod 2**64, which is what multiply-shift wants
+    hashed = (np.outer(x, _A) + _B) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def similarity(sig_a, sig_b):
+    # fraction of equal slots estimates the Jaccard similarity of the shingles
+    return float(np.count_nonzero(sig_a == sig_b)) / NUM_PERM
+
+
+def band_keys(sig):
+    return [
+        f"{band}:{hashlib.blake2b(sig[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).hexdigest()}"
+        for band in range(BANDS)
+    ]
+
+
+# ---------------------------------------
+# LSH INDEX (DISK CACHE BACKED)
+# ---------------------------------------
+class LSHIndex:
+    def __init__(self, cache=None):
+        self.cache = cache or get_cache()
+
+    def add(self, doc_key, sig):
+        self.cache.put(SIG_NAMESPACE, doc_key, sig.tolist())
+        keys = band_keys(sig)
+
+        def append(buckets):
+            updates = {}
+            for key in keys:
+                members = buckets.get(key, [])
+                if doc_key not in members:
+                    updates[key] = (members + [doc_key])[-MAX_BUCKET:]
+            return updates
+
+        # one transaction, so two uploads landing in the same bucket at
+        # once both stay in it
+        self.cache.update_many(LSH_NAMESPACE, keys, append)
+
+    def query(self, sig, threshold=NEAR_DUP_THRESHOLD):
+        """[(similarity, doc_key)] at or above `threshold`, best first. Only
+        documents sharing at least one band bucket are compared."""
+        candidates = set()
+        for members in self.cache.get_many(LSH_NAMESPACE, band_keys(sig)).values():
+            candidates.update(members)
+        if not candidates:
+            return []
+
+        stored = self.cache.get_many(SIG_NAMESPACE, candidates)
+        matches = []
+        for doc_key, other in stored.items():
+            sim = similarity(sig, np.asarray(other, dtype=np.uint32))
+            if sim >= threshold:
+                matches.append((sim, doc_key))
+        return sorted(matches, reverse=True)
+
+
+# ---------------------------------------
+# PARSE REUSE
+# ---------------------------------------
+# which ATS fields each resume section feeds; a changed section that feeds
+# none of them (certifications, awards) forces a full parse
+SECTION_FIELDS = {
+    "header": ("name", "email", "phone", "location"),
+    "summary": ("summary",),
+    "experience": ("experience_raw",),
+    "projects": ("projects_raw",),
+    "skills": ("skills_list", "soft_options"),
+    "education": ("education",),
+    "languages": ("languages",),
+    "declaration": ("declaration_raw",),
+}
+
+
+def text_digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def section_digests(text):
+    # whitespace-insensitive, so re-exported PDFs of the same resume match
+    return {
+        name: hashlib.sha1(" ".join(body.split()).encode("utf-8")).hexdigest()
+        for name, body in split_sections(text)
+    }
+
+
+def _empty_like(value):
+    return [] if isinstance(value, list) else ""
+
+
+def _reparse_changed(resume_text, sections, base, parse):
+    # None → the text can't be diffed against `base`; parse it in full
+    old_sections = base["sections"]
+    if len(sections) < 2 or len(old_sections) < 2:
+        return None             # no recognisable structure to diff
+
+    changed = [name for name, digest in sections.items() if old_sections.get(name) != digest]
+    removed = [name for name in old_sections if name not in sections]
+    if any(name not in SECTION_FIELDS for name in changed + removed):
+        return None
+
+    parsed = dict(base["parsed"])
+    if changed:
+        bodies = dict(split_sections(resume_text))
+        partial = parse("\n".join(f"{name.upper()}\n{bodies[name]}" for name in changed))
+        if not isinstance(partial, dict) or not any(partial.values()):
+            # LLM unavailable: a full parse would only fail again, after
+            # another round of retries
+            return partial if isinstance(partial, dict) else {}
+        for name in changed:
+            for field in SECTION_FIELDS[name]:
+                parsed[field] = partial.get(field, _empty_like(parsed.get(field)))
+    for name in removed:
+        for field in SECTION_FIELDS[name]:
+            parsed[field] = _empty_like(parsed.get(field))
+    return parsed
+
+
+def parse_with_reuse(resume_text, parse, index=None):
+    """Cached ATS parse. `parse(text) -> dict` is the LLM parser; it is
+    skipped for a text seen before, and only gets the changed sections
+    when the text is a near-duplicate of one parsed earlier."""
+    cache = get_cache()
+    digest = text_digest(resume_text)
+
+    hit = cache.get(PARSE_NAMESPACE, digest)
+    if hit:
+        return hit["parsed"]
+
+    index = index or LSHIndex(cache)
+    sections = section_digests(resume_text)
+    sig = minhash(resume_text)
+
+    parsed = None
+    if sig is not None:
+        for _, doc_key in index.query(sig):
+            base = cache.get(PARSE_NAMESPACE, doc_key)
+            if base:
+                parsed = _reparse_changed(resume_text, sections, base, parse)
+                break
+
+    if parsed is None:
+        parsed = parse(resume_text)
+
+    # an all-empty result means the LLM failed; don't remember that
+    if isinstance(parsed, dict) and any(parsed.values()):
+        cache.put(PARSE_NAMESPACE, digest, {"sections": sections, "parsed": parsed})
+        if sig is not None:
+            index.add(digest, sig)
+    return parsed
@@ -0,0 +1,78 @@
+import hashlib
+import importlib.util
+import os
+import shutil
+from io import BytesIO
+
+from disk_cache import get_cache
+
+# ---------------------------------------
+# OCR CONFIG
+# ---------------------------------------
+# OCR runs inline, in whichever process extracts the PDF: that is already a
+# cpu_pool / batch_rank worker, so no second pool is nested inside it
+OCR_MAX_PAGES = int(os.environ.get("RESUME_OCR_MAX_PAGES", "10"))
+OCR_PAGE_TIMEOUT = float(os.environ.get("RESUME_OCR_PAGE_TIMEOUT", "20"))
+OCR_DPI = 200
+OCR_LANG = os.environ.get("RESUME_OCR_LANG", "eng")
+
+CACHE_NAMESPACE = f"ocr:{OCR_DPI}:{OCR_LANG}"
+
+
+def tesseract_available():
+    return (
+        shutil.which("tesseract") is not None
+        and importlib.util.find_spec("pytesseract") is not None
+    )
+
+
+def _ocr_page(page, dpi, lang, timeout):
+    import pytesseract
+
+    image = page.to_image(resolution=dpi).original
+    try:
+        return pytesseract.image_to_string(image, lang=lang, timeout=timeout)
+    except RuntimeError:
+        # pytesseract kills tesseract and raises RuntimeError on timeout;
+        # None, not "", so the timeout isn't cached as an empty page
+        return None
+
+
+# ---------------------------------------
+# PUBLIC API
+# ---------------------------------------
+def ocr_pages(pdf_bytes, page_indexes):
+    """OCR the given pages of a PDF one after another, each under its own
+    timeout. Returns {page_index: text} for the pages that produced text;
+    results are cached by file hash."""
+    page_indexes = list(page_indexes)[:OCR_MAX_PAGES]
+    if not page_indexes or not tesseract_available():
+        return {}
+
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cache = get_cache()
+    cached = cache.get_many(CACHE_NAMESPACE, [f"{digest}:{i}" for i in page_indexes])
+    results = {i: cached[f"{digest}:{i}"] for i in page_indexes if f"{digest}:{i}" in cached}
+
+    missing = [i for i in page_indexes if i not in results]
+    if missing:
+        import pdfplumber
+
+        fresh = {}
+        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+            for i in missing:
+                page = pdf.pages[i]
+                try:
+                    text = _ocr_page(page, OCR_DPI, OCR_LANG, OCR_PAGE_TIMEOUT)
+                except Exception:
+                    # a broken page just keeps its (empty) text layer
+                    continue
+                finally:
+                    page.close()
+                if text is not None:
+                    fresh[i] = text
+        if fresh:
+            cache.put_many(CACHE_NAMESPACE, {f"{digest}:{i}": t for i, t in fresh.items()})
+        results.update(fresh)
+
+    return {i: t for i, t in results.items() if t.strip()}
@@ -1,7 +1,7 @@
 import streamlit as st
-import pdfplumber
-from docx import Document
-import requests
+import llm_client
+import skills_taxonomy
+import resume_extract
 
 # ---------------------------------------
 # OLLAMA CONFIG
@@ -12,33 +12,23 @@ MODEL_NAME = "llama3"
 # ---------------------------------------
 # TECH SKILL DATABASE
 # ---------------------------------------
-TECH_SKILLS = [
-    "python", "java", "mysql", "sql", "django", "flask",
-    "html", "css", "javascript", "react",
-    "aws", "docker", "git",
-    "machine learning", "data science"
-]
+# canonical names and aliases come from the shared taxonomy
+# (data/skills_taxonomy.tsv); cap the interview at this many skills
+MAX_SKILLS = 15
 
 # ---------------------------------------
 # RESUME TEXT EXTRACTION
 # ---------------------------------------
 def extract_resume_text(file):
-    text = ""
-    if file.name.endswith(".pdf"):
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-    else:
-        doc = Document(file)
-        for p in doc.paragraphs:
-            text += p.text + " "
-    return text.lower()
+    # same extraction as the builder (tables, OCR for scanned pages). Case is
+    # kept: skills_taxonomy matches Go, R, C, ... case-sensitively
+    return resume_extract.extract_resume_text(file)
 
 # ---------------------------------------
 # SKILL EXTRACTION
 # ---------------------------------------
 def extract_skills(text):
-    return list(set([s for s in TECH_SKILLS if s in text]))
+    return skills_taxonomy.extract_skills(text)[:MAX_SKILLS]
 
 # ---------------------------------------
 # QUESTION GENERATION (LLAMA 3)
@@ -58,16 +48,11 @@ def generate_questions(skill):
     - Questions must be practical and technical
     """
 
-    response = requests.post(
-        OLLAMA_URL,
-        json={
-            "model": MODEL_NAME,
-            "prompt": prompt,
-            "stream": False
-        }
-    )
-
-    data = response.json()
+    try:
+        data = llm_client.generate(OLLAMA_URL, MODEL_NAME, prompt)
+    except Exception:
+        # LLM down, busy, timed out or model missing → canned fallback
+        data = {}
 
     if "response" not in data:
         return [
@@ -106,16 +91,16 @@ def evaluate_answer(skill, question, answer):
     Feedback: ...
     """
 
-    response = requests.post(
-        OLLAMA_URL,
-        json={
-            "model": MODEL_NAME,
-            "prompt": prompt,
-            "stream": False
-        }
-    )
+    try:
+        data = llm_client.generate(OLLAMA_URL, MODEL_NAME, prompt)
+    except Exception:
+        data = {}
 
-    return response.json()["response"]
+    # no "Score:" line in the fallback, so it is left out of the total
+    return data.get(
+        "response",
+        "Feedback: Evaluation is unavailable right now. Please try again later."
+    )
 
 # ---------------------------------------
 # STREAMLIT UI
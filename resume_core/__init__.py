@@ -0,0 +1,43 @@
+"""Parsing, generation and rendering without Streamlit.
+
+The Streamlit app (r2.py), the HTTP API (api_server.py) and worker
+processes all import from here. Nothing in this package touches
+Streamlit, and submodules are only imported when one of their names is
+first used, so `import resume_core` stays cheap:
+
+    from resume_core import parse_resume_text, render_docx_bytes
+"""
+import importlib
+
+# public name → submodule that defines it
+_EXPORTS = {
+    "parse": [
+        "extract_contact_regex", "extract_location_safely", "ats_parse_resume",
+        "parse_resume_text", "parse_upload", "is_scanned",
+    ],
+    "generate": [
+        "generate_ai_content", "generate_summary_llama", "generate_resume_summary",
+        "generate_best_summary", "generate_technical_llama", "generate_experience_llama",
+        "generate_projects_llama", "generate_declaration_llama",
+    ],
+    "render": [
+        "create_docx", "create_sidebar_docx", "create_modern_sidebar_docx",
+        "get_docx_bytes", "render_docx_bytes", "render_key", "TEMPLATES",
+    ],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
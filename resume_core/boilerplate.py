@@ -0,0 +1,46 @@
+# ---------------------------------------
+# BOILERPLATE SECTIONS (NO LLM)
+# ---------------------------------------
+# sections whose wording barely varies between candidates are filled from
+# these templates; the LLM is only asked to rewrite text the user wrote
+DEFAULT_DECLARATION = (
+    "I hereby declare that the above information is true and correct to "
+    "the best of my knowledge and belief."
+)
+
+NAMED_DECLARATION = (
+    "I, {name}, hereby declare that the above information is true and correct "
+    "to the best of my knowledge and belief."
+)
+
+# {skills}: up to three of the candidate's skills, e.g. "Python, SQL and Git"
+FRESHER_BULLETS = (
+    "• Gained hands-on exposure to {skills} through internships, training and practical assignments",
+    "• Applied {skills} to complete assigned tasks, following documented processes and review feedback",
+    "• Collaborated with team members to deliver work on schedule and communicated progress clearly",
+)
+FALLBACK_SKILLS = "core technical skills"
+MAX_TEMPLATE_SKILLS = 3
+
+
+def _skill_phrase(skills):
+    names = [
+        (s.get("skill", "") if isinstance(s, dict) else str(s)).strip()
+        for s in skills
+    ]
+    names = [n for n in names if n][:MAX_TEMPLATE_SKILLS]
+    if not names:
+        return FALLBACK_SKILLS
+    if len(names) == 1:
+        return names[0]
+    return ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def declaration(data):
+    name = str(data.get("name", "")).strip()
+    return NAMED_DECLARATION.format(name=name) if name else DEFAULT_DECLARATION
+
+
+def fresher_experience(data):
+    skills = _skill_phrase(data.get("skills_list", []))
+    return "\n".join(line.format(skills=skills) for line in FRESHER_BULLETS)
@@ -0,0 +1,370 @@
+import os
+import random
+import threading
+
+import llm_client
+from llm_client import MODEL_NAME
+from llm_scheduler import PREFETCH, current_priority, scheduler
+from resume_core import boilerplate
+# fallback text is marked so it is never cached as a generated section
+from section_deps import Fallback, is_fallback
+from skill_descriptions import describe_skills
+# phrase lists live in data/text_rules.json; matchers are compiled once there
+from text_pipeline import (
+    analyze, sanitize_summary, classify_input, banned_word_hits,
+    is_intent_based_summary, is_invalid_summary, is_low_quality_summary
+)
+
+# ---------------------------------------
+# SECTION GENERATION (LLM, WITH FALLBACKS)
+# ---------------------------------------
+VARIATION_STYLES = [
+    "professional and concise",
+    "calm and neutral",
+    "confident but simple",
+    "reflective and academic",
+    "straightforward and ATS-friendly"
+]
+
+
+def generate_ai_content(prompt, fallback=""):
+    try:
+        response = llm_client.chat(model=MODEL_NAME, messages=[
+            {"role": "system", "content": "You are an expert resume writer. Provide ONLY the requested content. No conversational filler like 'Here is your summary'."},
+            {"role": "user", "content": prompt}
+        ])
+        return response['message']['content'].strip()
+    except Exception:
+        # LLM down, busy or timed out → deterministic fallback, never an error string
+        return Fallback(fallback)
+
+
+#summary
+def generate_summary_llama(data, user_summary=""):
+
+    # 🔒 HARD BLOCK: template-style input (safety net)
+    if user_summary and any(
+        x in user_summary.lower()
+        for x in ["[job title]", "[number", "[industry"]
+    ):
+        # In production, LOG instead of raising
+        raise ValueError("Template-style output detected. Block generation.")
+
+    raw_skills = data.get("skills_list", [])
+    experience = data.get("experience", "")
+
+    skills = ", ".join(
+        s.get("skill", "") if isinstance(s, dict) else str(s)
+        for s in raw_skills if s
+    )
+
+    # 🔹 CASE 1: Empty / Skip → FULL AUTO GENERATION
+    if not user_summary or not user_summary.strip():
+        prompt = f"""
+Write a professional, ATS-friendly resume summary.
+
+Rules:
+- Do NOT add headings
+- Do NOT use bullet points
+- Avoid generic phrases
+- Do NOT invent experience
+- Return ONLY the summary text
+
+Candidate Information:
+Skills: {skills}
+Experience: {experience}
+"""
+        return generate_ai_content(prompt)
+
+    # tokenized once, shared by the classifiers below
+    summary_text = analyze(user_summary)
+
+    # 🔹 CASE 2: Short but intent-based ("i am brilliant")
+    if is_intent_based_summary(summary_text):
+        prompt = f"""
+Professionally expand the following self-description into a resume summary.
+
+STRICT RULES:
+- Use ONLY the meaning of the user text
+- Do NOT add years of experience
+-do not add job title/ experience
+-do not add area of skills 
+-do not add [] type words
+- Do NOT add skills, tools, or industries
+- Do NOT add achievements or results
+- Keep it neutral and fresher-safe
+- ATS-friendly, plain sentences
+- Return ONLY the summary text
+
+User Text:
+"{user_summary}"
+"""
+        return generate_ai_content(prompt, fallback=user_summary.strip())
+
+    # 🔹 CASE 3: Very low quality junk
+    if is_low_quality_summary(summary_text):
+        prompt = f"""
+Write a professional, ATS-friendly resume summary.
+
+Rules:
+- Neutral tone
+- Fresher-safe
+- No invented experience
+-do not add years of experience
+-do not add job title/ experience
+-do not add area of skills 
+-do not add [] type words
+- Return ONLY the summary text
+"""
+        return generate_ai_content(prompt)
+
+    # 🔹 CASE 4: Valid summary → Improve
+    prompt = f"""
+Rewrite and professionally improve the following resume summary.
+
+Rules:
+- Preserve original meaning
+- Do NOT invent experience, skills, or achievements
+- ATS-friendly
+-do not add job title/ experience
+-do not add area of skills 
+-do not add [] type words
+- Return ONLY the rewritten summary
+
+User Summary:
+"{user_summary}"
+"""
+    return generate_ai_content(prompt, fallback=user_summary.strip())
+#def generate_unique_summary_from_input(user_summary: str) -> str:
+def _stream_reply(messages, priority, cancel):
+    # streamed so a losing best-of-N draft can stop mid-reply: closing the
+    # stream drops its Ollama connection and frees its scheduler slot
+    stream = llm_client.chat_stream(model=MODEL_NAME, messages=messages, priority=priority)
+    pieces = []
+    try:
+        for piece in stream:
+            if cancel.is_set():
+                return None
+            pieces.append(piece)
+    finally:
+        stream.close()
+    return {"message": {"content": "".join(pieces)}}
+
+
+def generate_resume_summary(user_input: str, style=None, priority=None, cancel=None) -> str:
+    if not user_input.strip():
+        raise ValueError("Summary input is required")
+
+    input_type = classify_input(user_input)
+    style = style or random.choice(VARIATION_STYLES)
+
+    prompt = f"""
+Rewrite the following content into a PROFESSIONAL RESUME SUMMARY.
+
+INPUT TYPE:
+- {input_type}
+
+STRICT RULES:
+- Use ONLY information explicitly stated by the user
+- Do NOT invent achievements, metrics, or responsibilities
+- Do NOT add personality traits or motivation
+- Keep tone professional and resume-appropriate
+- Expand naturally to 3–4 lines
+- ATS-safe wording
+- Output must be unique on every generation
+- Do NOT add job titles unless user mentions them
+
+STYLE:
+- {style}
+
+User Content:
+"{user_input}"
+
+Return ONLY the resume summary.
+"""
+
+    messages = [
+        {
+            "role": "system",
+            "content": "You generate factual resume summaries without assumptions."
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+    try:
+        if cancel is None:
+            response = llm_client.chat(model=MODEL_NAME, messages=messages, priority=priority)
+        else:
+            response = _stream_reply(messages, priority, cancel)
+    except Exception:
+        # keep the user's own words rather than blocking the wizard
+        return Fallback(sanitize_summary(user_input.strip()))
+
+    if response is None:
+        # cancelled: another draft already won
+        return Fallback("")
+
+    return sanitize_summary(response["message"]["content"].strip())
+
+#best-of-N summary
+SUMMARY_CANDIDATES = int(os.environ.get("RESUME_SUMMARY_CANDIDATES", "3"))
+SUMMARY_MIN_WORDS = 25
+SUMMARY_MAX_WORDS = 90
+
+def summary_penalty(text: str):
+    # lower is better; (0, 0, 0) means every quality gate passed
+    words = len(text.split())
+    if words < SUMMARY_MIN_WORDS:
+        length_gap = SUMMARY_MIN_WORDS - words
+    elif words > SUMMARY_MAX_WORDS:
+        length_gap = words - SUMMARY_MAX_WORDS
+    else:
+        length_gap = 0
+
+    invalid = not text.strip() or is_invalid_summary(text)
+    return (int(invalid), len(banned_word_hits(text)), length_gap)
+
+def generate_best_summary(user_input: str, n=SUMMARY_CANDIDATES) -> str:
+    if not user_input.strip():
+        raise ValueError("Summary input is required")
+
+    # one click never takes every LLM slot: leave at least one for other users
+    n = min(n, len(VARIATION_STYLES), scheduler.concurrency - 1)
+    styles = random.sample(VARIATION_STYLES, max(1, n))
+    if len(styles) == 1:
+        return generate_resume_summary(user_input, style=styles[0])
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # the first draft is what the caller asked for; the extra drafts are
+    # speculative and queue behind other users' interactive calls
+    base = current_priority()
+    priorities = [base] + [max(base, PREFETCH)] * (len(styles) - 1)
+
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=len(styles))
+    futures = [
+        pool.submit(generate_resume_summary, user_input, style, priority, cancel)
+        for style, priority in zip(styles, priorities)
+    ]
+
+    best, best_penalty = "", None
+    try:
+        for future in as_completed(futures):
+            candidate = future.result()
+            penalty = summary_penalty(candidate)
+
+            # early exit: first generated candidate that passes every gate wins
+            if penalty == (0, 0, 0) and not is_fallback(candidate):
+                return candidate
+
+            # a fallback (the user's own text) only wins if nothing was generated
+            penalty = (is_fallback(candidate),) + penalty
+
+            if best_penalty is None or penalty < best_penalty:
+                best, best_penalty = candidate, penalty
+    finally:
+        # don't wait for slower candidates once we have an answer: queued
+        # drafts are dropped, running ones stop reading and close their stream
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return best
+#techincal skills
+def generate_technical_llama(data):
+    skills = data.get("skills_list", [])
+
+    if not skills:
+        return ""
+
+    fell_back = False
+
+    def complete(prompt):
+        nonlocal fell_back
+        text = generate_ai_content(prompt)
+        fell_back = fell_back or is_fallback(text)
+        return text
+
+    # one cached line per skill; only skills nobody has asked for yet reach the LLM
+    text = describe_skills(skills, MODEL_NAME, complete)
+    return Fallback(text) if fell_back else text
+
+#experience
+def generate_experience_llama(data, is_fresher=False, years_of_exp=None, exp_text=""):
+    # nothing of the user's own to rewrite: fresher bullets come from a template
+    if is_fresher and not exp_text.strip():
+        return boilerplate.fresher_experience(data)
+
+    if years_of_exp is not None and 0 < years_of_exp <= 3:
+        prompt = (
+            f"Generate 3 resume bullet points for a candidate with {years_of_exp} years of IT experience."
+            "Use bullet points only (•)"
+            "Focus on skills, tools, teamwork"
+            "ATS-friendly"
+            "Return ONLY bullet points"
+        )
+
+    elif exp_text.strip():
+        prompt = (
+            "Rewrite the following experience into 3 ATS-optimized resume bullet points."
+            "Use bullet points only (•)"
+            "Return ONLY bullet points"
+            f"{exp_text}"
+        )
+
+    else:
+        prompt = (
+            "Generate exactly 3 resume bullet points based on technical skills and academic expsosure."
+            "Rules:"
+            "- Use bullet points only (•)"
+            "- ATS-friendly"
+            "- Return ONLY bullet points"
+        )
+
+    return generate_ai_content(prompt, fallback=exp_text.strip())
+
+#projects
+def generate_projects_llama(data, project_text=""):
+    skills = ", ".join(data.get("skills_list", []))
+
+    if project_text.strip():
+        prompt = (
+            "Rewrite the following into exactly 2 professional resume bullet points."
+            "Rules:"
+            "- Use bullet points only (•)"
+            "- Focus on tools, technologies and impact"
+            "- Do not mix with experience"
+            "- Return ONLY bullet points"
+            f"{project_text}"
+        )
+    else:
+        prompt = (
+            "Generate exactly 2 resume project bullet points."
+            "Rules:"
+            "- Use bullet points only (•)"
+            "- ATS-friendly"
+            "- Return ONLY bullet points"
+            f"Skills: {skills}"
+        )
+
+    return generate_ai_content(prompt, fallback=project_text.strip())
+
+#declaration
+def generate_declaration_llama(data, user_text=""):
+    # the LLM only ever rewrites the user's own declaration
+    if not user_text.strip():
+        return boilerplate.declaration(data)
+
+    prompt = (
+        "Rewrite the following resume declaration professionally. "
+        "Keep its meaning. "
+        "1–2 lines only. "
+        "Formal tone. "
+        "Return ONLY the declaration text.\n"
+        f"Declaration: {user_text.strip()}"
+    )
+
+    return generate_ai_content(prompt, fallback=user_text.strip())
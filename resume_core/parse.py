@@ -0,0 +1,117 @@
+import ats_parser
+from ats_parser import normalize_ats_data
+from resume_extract import extract_bytes
+from contact_extract import extract_contacts, national_number
+from gazetteer import find_location
+from llm_client import MODEL_NAME
+from llm_scheduler import INTERACTIVE, priority_scope
+
+# ---------------------------------------
+# RESUME TEXT → FORM FIELDS
+# ---------------------------------------
+# shared by the Streamlit upload job and the HTTP API (api_server.py)
+SCANNED_TEXT_CHARS = 200      # less text than this: probably a scanned PDF
+
+
+def extract_contact_regex(text):
+    # single pass over the resume header; see contact_extract.scan_contacts
+    found = extract_contacts(text)
+
+    phone = found["phone"].value if "phone" in found else ""
+
+    return {
+        "name": found["name"].value if "name" in found else "",
+        "email": found["email"].value if "email" in found else "",
+        # the form takes a 10-digit national number; keep E.164 alongside
+        "phone": national_number(phone) if phone else "",
+        # only when the country is certain (see contact_extract.normalize_phone)
+        "phone_e164": phone if phone.startswith("+") else "",
+        "linkedin": found["linkedin"].value if "linkedin" in found else "",
+        "github": found["github"].value if "github" in found else ""
+    }
+
+
+def _header_location(resume_text):
+    # gazetteer.Location from address-like lines in the first 15 lines; the
+    # name line is skipped so "Madison Clark" never becomes a city
+    name = extract_contacts(resume_text).get("name")
+    return find_location(resume_text, skip=[name.value] if name else ())
+
+
+def extract_location_safely(resume_text):
+    return _header_location(resume_text).name
+
+
+#autofill (schema-constrained JSON; see ats_parser.py)
+def ats_parse_resume(resume_text):
+    return ats_parser.parse_resume(resume_text, MODEL_NAME)
+
+
+def _ignore(*args):
+    pass
+
+
+def parse_resume_text(resume_text, stage=_ignore, publish=_ignore):
+    """Regex contacts + gazetteer location + the streamed ATS parse, merged
+    into one normalized record. `stage(name, progress)` reports progress;
+    `publish(fields)` receives fields as soon as each one is known."""
+    # regex contact details first: no LLM needed
+    stage("reading contact details", 0.15)
+    contact = extract_contact_regex(resume_text)
+    location = _header_location(resume_text)
+    early = {k: contact.get(k, "") for k in ["name", "email", "phone"]}
+    early["location"] = location.name
+    publish({k: v for k, v in early.items() if v})
+
+    # streamed ATS parse: each field is published as soon as it completes
+    stage("running ATS analysis", 0.2)
+    done_fields = set()
+
+    def on_field(key, value):
+        partial = normalize_ats_data({key: value})
+        partial = {k: v for k, v in partial.items() if v}
+        if location.certain:
+            partial.pop("location", None)   # an unambiguous gazetteer match wins
+        publish(partial)
+        done_fields.add(key)
+        stage(
+            f"running ATS analysis ({key} done)",
+            0.2 + 0.7 * len(done_fields) / len(ats_parser.ATS_DEFAULTS)
+        )
+
+    # exact repeats skip the LLM; near-duplicates only re-parse changed sections
+    from near_dup import parse_with_reuse
+    ats_output = parse_with_reuse(
+        resume_text,
+        lambda text: ats_parser.parse_resume_stream(text, MODEL_NAME, on_field)
+    )
+
+    # final record: ATS values, regex/gazetteer as before
+    stage("normalizing", 0.95)
+    parsed = normalize_ats_data(ats_output)
+    parsed["email"] = parsed.get("email") or contact.get("email", "")
+    parsed["phone"] = parsed.get("phone") or contact.get("phone", "")
+    parsed["name"]  = parsed.get("name")  or contact.get("name", "")
+    if location.certain or not parsed.get("location"):
+        parsed["location"] = location.name
+    return parsed
+
+
+def is_scanned(resume_text):
+    return len(resume_text.strip()) < SCANNED_TEXT_CHARS
+
+
+def parse_upload(job, data, mime_type, pool=None, priority=INTERACTIVE):
+    # a job_runner job (see r2's upload page): job.stage / job.partial only.
+    # With a cpu_pool the extraction runs in a worker process; a background
+    # job may wait for a free slot rather than fail. The job runs on a pool
+    # thread, but a user is watching its fields fill in: INTERACTIVE unless
+    # the caller is a bulk client
+    job.stage("extracting text", 0.05)
+    if pool is not None:
+        resume_text = pool.run(extract_bytes, data, mime_type, wait=None)
+    else:
+        resume_text = extract_bytes(data, mime_type)
+    with priority_scope(priority):
+        parsed = parse_resume_text(resume_text, job.stage, job.partial)
+    return {"parsed": parsed, "scanned": is_scanned(resume_text)}
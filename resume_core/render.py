@@ -0,0 +1,391 @@
+import hashlib
+import json
+from io import BytesIO
+
+# ---------------------------------------
+# DOCX TEMPLATES
+# ---------------------------------------
+# python-docx is imported inside each builder so importing this module
+# stays cheap (see bench_startup.py)
+
+
+def setup_one_page(doc):
+    from docx.shared import Inches
+
+    section = doc.sections[0]
+
+    # A4 Size
+    section.page_width = Inches(8.27)
+    section.page_height = Inches(11.69)
+
+    # Tight margins
+    section.top_margin = Inches(0.5)
+    section.bottom_margin = Inches(0.5)
+    section.left_margin = Inches(0.5)
+    section.right_margin = Inches(0.5)
+
+def get_docx_bytes(doc):
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer.getvalue()
+
+# --- Helper Function: Export to Docx ---
+def create_docx(data):
+    from docx import Document
+    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.shared import Pt
+
+    doc = Document()
+
+    # THIS LINE MAKES RESUME 1 PAGE
+    setup_one_page(doc)
+
+    # ===== HEADER =====
+    name_p = doc.add_heading(data["name"], level=0)
+    name_p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+    contact_p = doc.add_paragraph(
+        f"{data['email']} | {data['phone']} | {data['location']}"
+    )
+    contact_p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+    # ===== SUMMARY =====
+    if data.get("summary"):
+        h = doc.add_heading("Summary", level=1)
+        for r in h.runs:
+            r.font.size = Pt(11)
+
+        p = doc.add_paragraph(data["summary"])
+        p.paragraph_format.space_after = Pt(2)
+        p.paragraph_format.line_spacing = 1
+
+    # ===== EDUCATION =====
+    if data.get("education"):
+        h = doc.add_heading("Education", level=1)
+        for r in h.runs:
+            r.font.size = Pt(11)
+
+        for edu in data["education"]:
+            if not any(v.strip() for v in edu.values()):
+                continue
+
+            years = ""
+            if edu["startyear"] and edu["stopyear"]:
+                years = f"({edu['startyear']} – {edu['stopyear']})"
+            elif edu["startyear"] or edu["stopyear"]:
+                years = f"({edu['startyear'] or edu['stopyear']})"
+
+            p = doc.add_paragraph(
+                f"{edu['course']} {years} | {edu['school']} | {edu['board']} | "
+                f"SGPA: {edu['sgpa']}"
+            )
+            p.paragraph_format.space_after = Pt(2)
+            p.paragraph_format.line_spacing = 1
+
+    # ===== TECHNICAL SKILLS =====
+    h = doc.add_heading("Technical Skills", level=1)
+    for r in h.runs:
+        r.font.size = Pt(11)
+
+    tech_ai = data.get("technical_skills_ai", "")
+    if tech_ai:
+        for line in tech_ai.split("•"):
+            if line.strip():
+                p = doc.add_paragraph(f"• {line.strip()}")
+                p.paragraph_format.space_after = Pt(1)
+                p.paragraph_format.line_spacing = 1
+
+    # ===== EXPERIENCE =====
+    if data.get("experience"):
+        h = doc.add_heading("Experience", level=1)
+        for r in h.runs:
+            r.font.size = Pt(11)
+
+        for line in data["experience"].split("•"):
+            if line.strip():
+                p = doc.add_paragraph(f"• {line.strip()}")
+                p.paragraph_format.space_after = Pt(1)
+                p.paragraph_format.line_spacing = 1
+
+    # ===== PROJECTS =====
+    if data.get("projects"):
+        h = doc.add_heading("Projects", level=1)
+        for r in h.runs:
+            r.font.size = Pt(11)
+
+        for line in data["projects"].split("•"):
+            if line.strip():
+                p = doc.add_paragraph(f"• {line.strip()}")
+                p.paragraph_format.space_after = Pt(1)
+                p.paragraph_format.line_spacing = 1
+
+    # ===== DECLARATION =====
+    if data.get("declaration"):
+        h = doc.add_heading("Declaration", level=1)
+        for r in h.runs:
+            r.font.size = Pt(11)
+
+        p = doc.add_paragraph(data["declaration"])
+        p.paragraph_format.line_spacing = 1
+
+    return doc
+
+def set_cell_bg(cell, color):
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    tc = cell._tc
+    tcPr = tc.get_or_add_tcPr()
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:fill"), color)
+    tcPr.append(shd)
+
+def create_sidebar_docx(data):
+    from docx import Document
+    from docx.shared import Inches, Pt
+
+    doc = Document()
+
+    # FORCE 1 PAGE (MARGINS + A4)
+    setup_one_page(doc)
+
+    # ===== MAIN TABLE =====
+    table = doc.add_table(rows=1, cols=2)
+    table.autofit = False
+
+    left = table.rows[0].cells[0]
+    right = table.rows[0].cells[1]
+
+    left.width = Inches(2.4)
+    right.width = Inches(4.6)
+
+    # ===== LEFT SIDEBAR COLOR =====
+    set_cell_bg(left, "2F3A40")
+
+    # ===== HELPER FOR COMPACT TEXT =====
+    def add_compact(cell, text, bold=False):
+        p = cell.add_paragraph(text)
+        p.paragraph_format.space_before = Pt(1)
+        p.paragraph_format.space_after = Pt(1)
+        p.paragraph_format.line_spacing = 1
+        if bold:
+            p.runs[0].bold = True
+        for r in p.runs:
+            r.font.size = Pt(9)
+
+    # ===== LEFT CONTENT =====
+    name_p = left.paragraphs[0]
+    run = name_p.add_run(data["name"].upper())
+    run.bold = True
+    run.font.size = Pt(12)
+
+    add_compact(left, "\nCONTACT", bold=True)
+    add_compact(left, data.get("location", ""))
+    add_compact(left, str(data.get("phone", "")))
+    add_compact(left, data.get("email", ""))
+
+    add_compact(left, "\nSKILLS", bold=True)
+
+    tech_ai = data.get("technical_skills_ai", "")
+    if tech_ai:
+        for line in tech_ai.split("•"):
+            if line.strip():
+                add_compact(left, f"• {line.strip()}")
+    else:
+        for skill in data.get("skills_list", [])[:8]:
+            add_compact(left, f"• {skill}")
+
+    if data.get("languages"):
+        add_compact(left, "\nLANGUAGES", bold=True)
+        for lang in data["languages"][:4]:
+            add_compact(left, f"• {lang}")
+
+    if data.get("soft_options"):
+        add_compact(left, "\nSOFT SKILLS", bold=True)
+        for skill in data["soft_options"][:6]:
+            add_compact(left, f"• {skill}")
+
+    # ===== RIGHT CONTENT =====
+    def add_heading(cell, text):
+        p = cell.add_paragraph(f"\n{text}")
+        p.runs[0].bold = True
+        for r in p.runs:
+            r.font.size = Pt(11)
+
+    def add_para(cell, text):
+        p = cell.add_paragraph(text)
+        p.paragraph_format.space_before = Pt(1)
+        p.paragraph_format.space_after = Pt(1)
+        p.paragraph_format.line_spacing = 1
+        for r in p.runs:
+            r.font.size = Pt(9.5)
+
+    if data.get("summary"):
+        add_heading(right, "PROFESSIONAL SUMMARY")
+        add_para(right, data["summary"])
+
+    if data.get("experience"):
+        add_heading(right, "EXPERIENCE")
+        for line in data["experience"].split("•"):
+            if line.strip():
+                add_para(right, f"• {line.strip()}")
+
+    if data.get("projects"):
+        add_heading(right, "PROJECTS")
+        for line in data["projects"].split("•"):
+            if line.strip():
+                add_para(right, f"• {line.strip()}")
+
+    if data.get("education"):
+        add_heading(right, "EDUCATION")
+        for edu in data["education"]:
+            if not any(v.strip() for v in edu.values()):
+                continue
+
+            years = ""
+            if edu["startyear"] and edu["stopyear"]:
+                years = f"({edu['startyear']} – {edu['stopyear']})"
+            elif edu["startyear"] or edu["stopyear"]:
+                years = f"({edu['startyear'] or edu['stopyear']})"
+
+            edu_line = (
+                f"{edu['course']} {years} | "
+                f"{edu['school']} | {edu['board']} | "
+                f"SGPA: {edu['sgpa']}"
+            )
+            add_para(right, edu_line)
+
+    if data.get("declaration"):
+        add_heading(right, "DECLARATION")
+        add_para(right, data["declaration"])
+
+    return doc
+
+def create_modern_sidebar_docx(data):
+    from docx import Document
+    from docx.shared import Inches, Pt
+
+    doc = Document()
+
+    # FORCE SINGLE PAGE (A4 + TIGHT MARGINS)
+    setup_one_page(doc)
+
+    # ===== MAIN TABLE =====
+    table = doc.add_table(rows=1, cols=2)
+    table.autofit = False
+
+    left = table.rows[0].cells[0]
+    right = table.rows[0].cells[1]
+
+    left.width = Inches(4.6)
+    right.width = Inches(2.4)
+
+    # ===== RIGHT SIDEBAR COLOR =====
+    set_cell_bg(right, "E9CBF2")
+
+    # ===== COMPACT HELPERS =====
+    def add_heading(cell, text):
+        p = cell.add_paragraph(f"\n{text}")
+        p.runs[0].bold = True
+        for r in p.runs:
+            r.font.size = Pt(11)
+
+    def add_text(cell, text, size=9.5):
+        p = cell.add_paragraph(text)
+        p.paragraph_format.space_before = Pt(1)
+        p.paragraph_format.space_after = Pt(1)
+        p.paragraph_format.line_spacing = 1
+        for r in p.runs:
+            r.font.size = Pt(size)
+
+    # ===== LEFT MAIN CONTENT =====
+    name_p = left.paragraphs[0]
+    run = name_p.add_run(data["name"].upper())
+    run.bold = True
+    run.font.size = Pt(18)
+
+    if data.get("summary"):
+        add_heading(left, "PROFESSIONAL SUMMARY")
+        add_text(left, data["summary"])
+
+    if data.get("experience"):
+        add_heading(left, "EXPERIENCE")
+        for line in data["experience"].split("•"):
+            if line.strip():
+                add_text(left, f"• {line.strip()}")
+
+    if data.get("projects"):
+        add_heading(left, "PROJECTS")
+        for line in data["projects"].split("•"):
+            if line.strip():
+                add_text(left, f"• {line.strip()}")
+
+    if data.get("declaration"):
+        add_heading(left, "DECLARATION")
+        add_text(left, data["declaration"])
+
+    # ===== RIGHT SIDEBAR CONTENT =====
+    add_heading(right, "CONTACT")
+    add_text(right, data.get("location", ""), size=9)
+    add_text(right, str(data.get("phone", "")), size=9)
+    add_text(right, data.get("email", ""), size=9)
+
+    add_heading(right, "SKILLS")
+    tech_ai = data.get("technical_skills_ai", "")
+    if tech_ai:
+        for line in tech_ai.split("•"):
+            if line.strip():
+                add_text(right, f"• {line.strip()}", size=9)
+    else:
+        for skill in data.get("skills_list", [])[:8]:
+            add_text(right, f"• {skill}", size=9)
+
+    if data.get("soft_options"):
+        add_heading(right, "SOFT SKILLS")
+        for skill in data["soft_options"][:6]:
+            add_text(right, f"• {skill}", size=9)
+
+    if data.get("languages"):
+        add_heading(right, "LANGUAGES")
+        for lang in data["languages"][:4]:
+            add_text(right, f"• {lang}", size=9)
+
+    if data.get("education"):
+        add_heading(right, "EDUCATION")
+        for edu in data["education"]:
+            if not any(v.strip() for v in edu.values()):
+                continue
+
+            years = ""
+            if edu["startyear"] and edu["stopyear"]:
+                years = f"({edu['startyear']} – {edu['stopyear']})"
+            elif edu["startyear"] or edu["stopyear"]:
+                years = f"({edu['startyear'] or edu['stopyear']})"
+
+            edu_line = (
+                f"{edu['course']} {years} | "
+                f"{edu['school']} | {edu['board']} | "
+                f"SGPA: {edu['sgpa']}"
+            )
+            add_text(right, edu_line, size=9)
+
+    return doc
+
+
+TEMPLATES = {
+    "simple": create_docx,
+    "sidebar": create_sidebar_docx,
+    "modern": create_modern_sidebar_docx,
+}
+
+
+def render_docx_bytes(data, template):
+    # unknown or missing template → the simple layout, as the wizard always did
+    return get_docx_bytes(TEMPLATES.get(template, create_docx)(data))
+
+
+def render_key(data, template):
+    # same data + template → same DOCX, so callers can skip re-rendering
+    payload = json.dumps([template, data], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,164 @@
+import os
+from io import BytesIO
+
+from ocr_fallback import ocr_pages
+
+# ---------------------------------------
+# RESUME TEXT EXTRACTION (PDF / DOCX)
+# ---------------------------------------
+# shared by the Streamlit apps and batch_rank.py; pdfplumber is imported on
+# first use, DOCX is read straight from its XML
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+MIME_TYPES = {".pdf": PDF_TYPE, ".docx": DOCX_TYPE}
+
+# peak memory per extraction is bounded by these, whatever gets uploaded
+MAX_UPLOAD_BYTES = int(os.environ.get("RESUME_MAX_UPLOAD_MB", "10")) * 1024 * 1024
+MAX_PDF_PAGES = int(os.environ.get("RESUME_MAX_PDF_PAGES", "30"))
+MAX_DOCX_XML_BYTES = 20 * 1024 * 1024      # uncompressed document.xml (zip bomb guard)
+
+
+class UploadTooLarge(ValueError):
+    """The upload is over a size or page limit; nothing was extracted."""
+
+
+def check_upload_size(size):
+    if size > MAX_UPLOAD_BYTES:
+        raise UploadTooLarge(
+            f"The file is {size / 1024 / 1024:.1f} MB; the limit is "
+            f"{MAX_UPLOAD_BYTES // 1024 // 1024} MB."
+        )
+
+
+def _pdf_page_count(pdf):
+    # read from the page tree root, so no page is parsed to get it
+    from pdfminer.pdftypes import resolve1
+
+    try:
+        return int(resolve1(pdf.doc.catalog["Pages"])["Count"])
+    except Exception:
+        return None             # damaged page tree: the loop below still enforces it
+
+
+def iter_pdf_pages(data, max_pages=MAX_PDF_PAGES):
+    """Yield (page_index, text, has_text_layer) one page at a time. Each
+    page's layout objects are released before the next one is parsed."""
+    import pdfplumber
+
+    check_upload_size(len(data))
+    with pdfplumber.open(BytesIO(data)) as pdf:
+        count = _pdf_page_count(pdf)
+        if count is not None and count > max_pages:
+            raise UploadTooLarge(f"The PDF has {count} pages; the limit is {max_pages}.")
+
+        for i, page in enumerate(pdf.pages):
+            if i >= max_pages:
+                raise UploadTooLarge(f"The PDF has more than {max_pages} pages.")
+            try:
+                has_text_layer = bool(page.chars)
+                yield i, page.extract_text() or "", has_text_layer
+            finally:
+                page.close()    # drops the cached chars/layout (flush_cache)
+
+
+def extract_pdf_text(data):
+    pages = []
+    scanned = []
+
+    for i, page_text, has_text_layer in iter_pdf_pages(data):
+        # no text layer at all → image-only page, OCR it below
+        if not has_text_layer:
+            scanned.append(i)
+        pages.append(page_text)
+
+    for i, page_text in ocr_pages(data, scanned).items():
+        pages[i] = page_text
+
+    return "".join(page_text + "\n" for page_text in pages if page_text)
+
+
+# WordprocessingML names used by the DOCX reader below
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_P, _T, _TAB, _BR, _CR = _W + "p", _W + "t", _W + "tab", _W + "br", _W + "cr"
+
+
+def iter_docx_paragraphs(data):
+    """Yield the text of every non-empty paragraph in document order
+    (body text and table cells interleaved as they appear), streaming
+    word/document.xml straight from the zip. Images and the rest of the
+    package are never read."""
+    import zipfile
+    from xml.etree.ElementTree import iterparse
+
+    check_upload_size(len(data))
+    try:
+        zf = zipfile.ZipFile(BytesIO(data))
+        info = zf.getinfo("word/document.xml")
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError("Not a .docx file.") from None
+    if info.file_size > MAX_DOCX_XML_BYTES:
+        raise UploadTooLarge("The document is too large to read.")
+
+    paragraphs = []             # open paragraph buffers; text boxes nest a w:p in a w:p
+    fallback_depth = 0          # mc:Fallback repeats the mc:Choice content (old Word)
+
+    with zf, zf.open(info) as xml:
+        for event, elem in iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1 if event == "start" else -1
+                continue
+            if fallback_depth:
+                continue
+
+            if event == "start":
+                if tag == _P:
+                    paragraphs.append([])
+                continue
+
+            if tag == _T and paragraphs:
+                paragraphs[-1].append(elem.text or "")
+            elif tag == _TAB and paragraphs:
+                paragraphs[-1].append("\t")
+            elif tag in (_BR, _CR) and paragraphs:
+                paragraphs[-1].append("\n")
+            elif tag == _P:
+                text = "".join(paragraphs.pop())
+                elem.clear()    # keep memory flat on long documents
+                if text.strip():
+                    yield text
+
+
+def extract_docx_text(data):
+    # document order, so sidebar templates (tables) read in layout order;
+    # see bench_docx_extract.py for the comparison with python-docx
+    return "".join(text + "\n" for text in iter_docx_paragraphs(data))
+
+
+def extract_bytes(data, mime_type):
+    if mime_type == PDF_TYPE:
+        return extract_pdf_text(data)
+    if mime_type == DOCX_TYPE:
+        return extract_docx_text(data)
+    return ""
+
+
+def mime_type_for(name):
+    return MIME_TYPES.get(os.path.splitext(name)[1].lower(), "")
+
+
+def upload_mime_type(file):
+    # a Streamlit UploadedFile; browsers sometimes report a generic type,
+    # so fall back to the file extension
+    return file.type if file.type in (PDF_TYPE, DOCX_TYPE) else mime_type_for(file.name)
+
+
+def extract_resume_text(file):
+    return extract_bytes(file.getvalue(), upload_mime_type(file))
+
+
+def extract_file(path):
+    with open(path, "rb") as f:
+        return extract_bytes(f.read(), mime_type_for(path))
@@ -0,0 +1,60 @@
+import hashlib
+import json
+
+# ---------------------------------------
+# SECTION DEPENDENCY GRAPH
+# ---------------------------------------
+# generated section → the inputs its prompt is built from. A section is
+# regenerated only when the fingerprint of these inputs changes; inputs that
+# are themselves generated ("experience") chain the invalidation.
+DEPENDENCIES = {
+    "summary": ("summary_input", "skills_list", "experience"),
+    "technical_skills_ai": ("skills_list",),
+    "experience": ("experience_raw", "is_fresher", "years_of_exp", "skills_list"),
+    "projects": ("projects_raw", "skills_list"),
+    "declaration": ("declaration_raw",),
+}
+
+FINGERPRINTS_KEY = "_fingerprints"
+
+
+class Fallback(str):
+    """Text a generator returned in place of an LLM answer (the LLM was
+    down, busy or timed out). Carried on the value itself so `regenerate()`
+    never caches it, whichever thread or session produced it."""
+
+
+def is_fallback(value):
+    return isinstance(value, Fallback)
+
+
+def fingerprint(section, inputs):
+    payload = json.dumps(
+        [section, [inputs[name] for name in DEPENDENCIES[section]]],
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def regenerate(form_data, section, inputs, generate):
+    """Set form_data[section] from `generate()` unless the section's inputs
+    are unchanged since the last generation, in which case the stored text
+    is reused. `inputs` must hold exactly DEPENDENCIES[section]."""
+    if set(inputs) != set(DEPENDENCIES[section]):
+        raise KeyError(f"{section} depends on {DEPENDENCIES[section]}, got {sorted(inputs)}")
+
+    records = form_data.setdefault(FINGERPRINTS_KEY, {})
+    fp = fingerprint(section, inputs)
+    record = records.get(section)
+
+    if record and record["fingerprint"] == fp:
+        value = record["value"]
+    else:
+        value = generate()
+        if is_fallback(value):
+            records.pop(section, None)
+        else:
+            records[section] = {"fingerprint": fp, "value": value}
+
+    form_data[section] = str(value)
+    return value
@@ -0,0 +1,70 @@
+import re
+
+import skills_taxonomy
+from disk_cache import get_cache
+
+# ---------------------------------------
+# PER-SKILL DESCRIPTION CACHE
+# ---------------------------------------
+# one line per canonical skill, shared by every user; bump PROMPT_VERSION
+# whenever the prompt below changes so old lines are not reused
+PROMPT_VERSION = 1
+NAMESPACE = "skill_desc"
+MAX_DESCRIPTION_CHARS = 160
+
+# "Python: ...", "- Python: ...", "1. **Python** – ..."
+LINE_RE = re.compile(r"^(?:[•*\-]+|\d+[.)])?\s*(?P<skill>[^:–—]+?)\s*[:–—]\s*(?P<desc>.+)$")
+
+
+def cache_key(model, skill):
+    return f"{model}:v{PROMPT_VERSION}:{skills_taxonomy.canonical(skill).lower()}"
+
+
+def build_prompt(skills):
+    return (
+        "For each skill below, write a 1-line professional description of what "
+        "a candidate with that skill can do.\n"
+        "Rules:\n"
+        "- One line per skill, formatted exactly as: Skill: description\n"
+        "- Keep the skill names exactly as given\n"
+        "- No bullet symbols, headings or extra text\n"
+        f"Skills: {', '.join(skills)}"
+    )
+
+
+def parse_descriptions(text, skills):
+    # map whatever the model wrote back onto the requested skills
+    wanted = {skills_taxonomy.canonical(s).lower(): s for s in skills}
+    found = {}
+    for line in text.splitlines():
+        m = LINE_RE.match(line.strip())
+        if not m:
+            continue
+        name = m.group("skill").strip("* ")
+        skill = wanted.get(skills_taxonomy.canonical(name).lower())
+        desc = m.group("desc").strip().rstrip(".")
+        if skill and desc and skill not in found:
+            found[skill] = desc[:MAX_DESCRIPTION_CHARS]
+    return found
+
+
+def describe_skills(skills, model, complete):
+    """Bulleted "• Skill: description" lines in the user's order. Cached
+    skills cost nothing; the misses go to `complete(prompt)` in one batch.
+    Skills the model didn't describe are listed bare and not cached."""
+    cache = get_cache()
+    keys = {skill: cache_key(model, skill) for skill in skills}
+    cached = cache.get_many(NAMESPACE, set(keys.values()))
+    descriptions = {skill: cached[key] for skill, key in keys.items() if key in cached}
+
+    missing = [skill for skill in skills if skill not in descriptions]
+    if missing:
+        fresh = parse_descriptions(complete(build_prompt(missing)), missing)
+        if fresh:
+            cache.put_many(NAMESPACE, {keys[skill]: desc for skill, desc in fresh.items()})
+        descriptions.update(fresh)
+
+    return "\n".join(
+        f"• {skill}: {descriptions[skill]}" if skill in descriptions else f"• {skill}"
+        for skill in skills
+    )
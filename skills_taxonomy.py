@@ -0,0 +1,178 @@
+"""Shared skills taxonomy: canonical names, aliases and categories.
+
+data/skills_taxonomy.tsv is the editable source. `python skills_taxonomy.py`
+compiles it into data/skills_taxonomy.idx (same snapshot format as the
+gazetteer), which is rebuilt automatically when the TSV changes.
+"""
+import os
+import re
+import sys
+
+from snapshot import DATA_DIR, build_snapshot, load_snapshot
+
+SOURCE_PATH = os.path.join(DATA_DIR, "skills_taxonomy.tsv")
+SNAPSHOT_PATH = os.path.join(DATA_DIR, "skills_taxonomy.idx")
+SNAPSHOT_VERSION = 1
+
+SOFT = "soft"
+LANGUAGE = "language"
+TECH_CATEGORIES = (
+    "programming", "web", "mobile", "database", "cloud",
+    "devops", "data", "testing", "tool",
+)
+
+# "Node.js", "C++", "C#" and ".NET" stay whole; "/" and "-" split
+# ("HTML/CSS", "scikit-learn") so aliases and free text tokenize alike
+TOKEN_RE = re.compile(r"\.?[^\W_][\w+#]*(?:\.[^\W_][\w+#]*)*")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text)
+
+
+def _key(text):
+    return " ".join(tokenize(text.lower()))
+
+
+# ---------------------------------------
+# BUILD
+# ---------------------------------------
+def build_index(path=SOURCE_PATH):
+    """names/categories are parallel lists; `lookup` maps a normalized
+    whole string to an entry id; `index` is the first-token phrase index
+    used for free text: index[token] → tuple of (rest, entry_id, exact),
+    longest phrase first. exact phrases only match as written ("Go", "R")."""
+    names, categories = [], []
+    lookup = {}
+    phrases = []                    # (tokens, entry_id, exact)
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            cols = line.rstrip("\n").split("\t") + [""] * 3
+            name, category, aliases = cols[:3]
+            if _key(name) in lookup:
+                continue
+
+            entry_id = len(names)
+            names.append(name)
+            categories.append(category)
+
+            aliases = [a for a in aliases.split("|") if a]
+            exact = {a[1:] for a in aliases if a.startswith("=")}
+            for alias in [name] + [a.lstrip("=") for a in aliases]:
+                lookup.setdefault(_key(alias), entry_id)
+                if alias in exact:
+                    phrases.append((tuple(tokenize(alias)), entry_id, True))
+                elif not any(_key(alias) == _key(e) for e in exact):
+                    phrases.append((tuple(tokenize(alias.lower())), entry_id, False))
+
+    index = {}
+    for tokens, entry_id, exact in sorted(phrases, key=lambda p: -len(p[0])):
+        if tokens:
+            index.setdefault(tokens[0], []).append((tokens[1:], entry_id, exact))
+
+    return {
+        "names": names,
+        "categories": categories,
+        "lookup": lookup,
+        "index": {k: tuple(v) for k, v in index.items()},
+    }
+
+
+_index = None
+
+
+def get_index():
+    global _index
+    if _index is None:
+        _index = load_snapshot(SOURCE_PATH, SNAPSHOT_PATH, SNAPSHOT_VERSION, build_index)
+    return _index
+
+
+# ---------------------------------------
+# LOOKUP
+# ---------------------------------------
+def lookup(skill):
+    """(canonical name, category) for a skill string, or None if unknown."""
+    idx = get_index()
+    entry_id = idx["lookup"].get(_key(skill))
+    if entry_id is None:
+        return None
+    return idx["names"][entry_id], idx["categories"][entry_id]
+
+
+def canonical(skill):
+    hit = lookup(skill)
+    return hit[0] if hit else skill.strip()
+
+
+def category(skill):
+    hit = lookup(skill)
+    return hit[1] if hit else ""
+
+
+def is_soft(skill):
+    return category(skill) == SOFT
+
+
+def options(category):
+    # canonical names of one category, in file order (for select widgets)
+    idx = get_index()
+    return [n for n, c in zip(idx["names"], idx["categories"]) if c == category]
+
+
+def normalize_skills(skills):
+    """Canonicalize and dedup a list of skill strings, keeping the first
+    occurrence's position. Unknown skills are kept as written."""
+    seen = set()
+    result = []
+    for skill in skills:
+        name = canonical(str(skill))
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            result.append(name)
+    return result
+
+
+def scan(tokens):
+    """Yield (position, length, name, category) for every skill in a token
+    list from tokenize(): one pass, longest alias match at each position."""
+    idx = get_index()
+    names, cats, phrases = idx["names"], idx["categories"], idx["index"]
+    lower = [t.lower() for t in tokens]
+
+    i = 0
+    while i < len(tokens):
+        hit = None
+        for key, words, exact in ((lower[i], lower, False), (tokens[i], tokens, True)):
+            for rest, entry_id, phrase_exact in phrases.get(key, ()):
+                if phrase_exact != exact:
+                    continue
+                n = len(rest)
+                if tuple(words[i + 1:i + 1 + n]) == rest:
+                    if hit is None or n + 1 > hit[1]:
+                        hit = (entry_id, n + 1)
+                    break
+        if hit:
+            entry_id, length = hit
+            yield i, length, names[entry_id], cats[entry_id]
+            i += length
+        else:
+            i += 1
+
+
+def extract_skills(text, categories=TECH_CATEGORIES):
+    """Canonical skills mentioned in free text, in order of first mention."""
+    found = []
+    for _, _, name, cat in scan(tokenize(text)):
+        if cat in categories and name not in found:
+            found.append(name)
+    return found
+
+
+if __name__ == "__main__":
+    data = build_snapshot(SOURCE_PATH, SNAPSHOT_PATH, SNAPSHOT_VERSION, build_index)
+    print(f"wrote {SNAPSHOT_PATH}: {len(data['names'])} skills, "
+          f"{len(data['lookup'])} aliases", file=sys.stderr)
@@ -0,0 +1,51 @@
+import hashlib
+import os
+import pickle
+
+# ---------------------------------------
+# PREBUILT BINARY SNAPSHOTS OF BUNDLED DATA
+# ---------------------------------------
+# A snapshot is a pickled index built from an editable source file under
+# data/. It records the source's SHA-256, so a stale snapshot is rebuilt
+# (and rewritten when the directory is writable) instead of being trusted.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def source_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_snapshot(data, path):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def build_snapshot(source_path, snapshot_path, version, build):
+    data = build(source_path)
+    data["version"] = version
+    data["source"] = source_digest(source_path)
+    write_snapshot(data, snapshot_path)
+    return data
+
+
+def load_snapshot(source_path, snapshot_path, version, build):
+    digest = source_digest(source_path)
+    try:
+        with open(snapshot_path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") == version and data.get("source") == digest:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    data = build(source_path)
+    data["version"] = version
+    data["source"] = digest
+    try:
+        write_snapshot(data, snapshot_path)
+    except OSError:
+        pass        # read-only install: keep the freshly built index in memory
+    return data
@@ -0,0 +1,60 @@
+import sqlite3
+
+from draft_store import DraftStore
+
+
+def _rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT draft_id, payload FROM drafts").fetchall()
+
+
+def test_save_is_written_behind(tmp_path):
+    path = str(tmp_path / "drafts.db")
+    store = DraftStore(path, flush_interval=60)
+    try:
+        store.save("d1", {"name": "Ada"})
+        # not on disk yet, but a load already sees it
+        assert _rows(path) == []
+        assert store.load("d1") == {"name": "Ada"}
+    finally:
+        store.close()
+
+
+def test_close_flushes_pending_saves(tmp_path):
+    path = str(tmp_path / "drafts.db")
+    store = DraftStore(path, flush_interval=60)
+    store.save("d1", {"name": "Ada"})
+    store.save("d1", {"name": "Ada Lovelace"})
+    store.save("d2", {"step": 3})
+    store.close()
+
+    reopened = DraftStore(path, flush_interval=60)
+    try:
+        assert reopened.load("d1") == {"name": "Ada Lovelace"}
+        assert reopened.load("d2") == {"step": 3}
+        assert reopened.load("missing") is None
+    finally:
+        reopened.close()
+
+
+def test_unchanged_save_is_skipped(tmp_path):
+    store = DraftStore(str(tmp_path / "drafts.db"), flush_interval=60)
+    try:
+        store.save("d1", {"name": "Ada"})
+        store.flush()
+        store.save("d1", {"name": "Ada"})
+        assert store._pending == {}
+    finally:
+        store.close()
+
+
+def test_delete_drops_pending_and_stored(tmp_path):
+    path = str(tmp_path / "drafts.db")
+    store = DraftStore(path, flush_interval=60)
+    store.save("d1", {"name": "Ada"})
+    store.flush()
+    store.save("d1", {"name": "Ada Lovelace"})
+    store.delete("d1")
+    store.close()
+
+    assert _rows(path) == []
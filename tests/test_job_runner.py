@@ -0,0 +1,65 @@
+import threading
+import time
+
+from job_runner import DONE, FAILED, RUNNING, JobRunner
+
+
+def _wait_for_status(runner, job_id, status, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while runner.get(job_id).status != status:
+        assert time.monotonic() < deadline, f"job never reached {status}"
+        time.sleep(0.01)
+
+
+def test_job_reports_progress_partials_and_result(tmp_path):
+    runner = JobRunner(str(tmp_path / "jobs.db"), max_workers=1)
+
+    def work(progress, name):
+        progress.stage("reading", 0.5)
+        progress.partial({"name": name})
+        return {"ok": True}
+
+    try:
+        job_id = runner.submit("parse", work, "Ada")
+        _wait_for_status(runner, job_id, DONE)
+        job = runner.get(job_id)
+        assert job.partial == {"name": "Ada"}
+        assert job.result == {"ok": True}
+        assert job.progress == 1.0
+    finally:
+        runner.shutdown()
+
+
+def test_failed_job_keeps_the_error(tmp_path):
+    runner = JobRunner(str(tmp_path / "jobs.db"), max_workers=1)
+
+    def work(progress):
+        raise ValueError("no text")
+
+    try:
+        job_id = runner.submit("parse", work)
+        _wait_for_status(runner, job_id, FAILED)
+        assert runner.get(job_id).error == "ValueError: no text"
+    finally:
+        runner.shutdown()
+
+
+def test_restart_marks_unfinished_jobs_failed(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    release = threading.Event()
+    old = JobRunner(path, max_workers=1)
+    try:
+        running = old.submit("parse", lambda progress: release.wait(5))
+        queued = old.submit("parse", lambda progress: None)
+        _wait_for_status(old, running, RUNNING)
+
+        # a new server process opens the same database
+        restarted = JobRunner(path, max_workers=1)
+        for job_id in (running, queued):
+            job = restarted.get(job_id)
+            assert job.status == FAILED
+            assert job.error == "interrupted by a server restart"
+        restarted.shutdown()
+    finally:
+        release.set()
+        old.shutdown()
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+import llm_client
+from llm_client import SingleFlight
+from llm_resilience import CircuitBreaker, LLMUnavailable
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    runs = []
+    results = []
+
+    def fn():
+        runs.append(1)
+        release.wait(5)
+        return {"answer": 42}
+
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", fn)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+
+    deadline = time.monotonic() + 5
+    while flight.stats()["shared"] < 4:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(runs) == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "shared": 4}
+
+
+def test_waiters_get_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def fn():
+        release.wait(5)
+        raise RuntimeError("down")
+
+    def call():
+        try:
+            flight.do("key", fn)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    while flight.stats()["shared"] < 2:
+        time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert len(errors) == 3
+    # the key is free again once the leader is done
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats()["executed"] == 2
+
+
+@pytest.fixture
+def open_breaker(monkeypatch):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    monkeypatch.setattr(llm_client, "_breaker", breaker)
+    monkeypatch.setattr(llm_client, "_last_good", llm_client.OrderedDict())
+
+
+def test_open_breaker_serves_last_good_deterministic_reply(open_breaker):
+    options = {"options": {"temperature": 0}}
+    reply = {"message": {"content": "cached"}}
+    llm_client._remember(llm_client.request_key("chat", "m", [], options), reply)
+
+    assert llm_client.chat("m", [], **options) == reply
+    assert list(llm_client.chat_stream("m", [], **options)) == ["cached"]
+
+
+def test_open_breaker_never_serves_a_sampled_reply(open_breaker):
+    reply = {"message": {"content": "cached"}}
+    llm_client._remember(llm_client.request_key("chat", "m", [], {}), reply)
+
+    with pytest.raises(LLMUnavailable):
+        llm_client.chat("m", [])
+    with pytest.raises(LLMUnavailable):
+        list(llm_client.chat_stream("m", []))
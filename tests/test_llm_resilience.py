@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+import llm_resilience
+from llm_resilience import CircuitBreaker, LLMUnavailable, call_with_retry
+
+
+def test_breaker_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()      # only one trial at a time
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_successful_trial_closes():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_released_trial_goes_to_the_next_caller():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    breaker.release_trial()
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+
+
+def test_retries_until_attempts_run_out(monkeypatch):
+    monkeypatch.setattr(llm_resilience.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def attempt(timeout):
+        calls.append(timeout)
+        raise ConnectionError("refused")
+
+    with pytest.raises(LLMUnavailable):
+        call_with_retry(attempt, lambda e: True, attempts=3, call_timeout=5)
+    assert len(calls) == 3
+    assert all(t <= 5 for t in calls)
+
+
+def test_non_retryable_errors_propagate():
+    calls = []
+
+    def attempt(timeout):
+        calls.append(timeout)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        call_with_retry(attempt, lambda e: False)
+    assert len(calls) == 1
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from llm_scheduler import (
+    BATCH, INTERACTIVE, PREFETCH, PRIORITY_NAMES, Scheduler, SchedulerBusy,
+    current_priority, priority_scope
+)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting"
+        time.sleep(0.005)
+
+
+def _queued(scheduler, priority):
+    return scheduler.metrics()["queue_depth"][PRIORITY_NAMES[priority]]
+
+
+def test_waiting_requests_run_in_priority_order():
+    scheduler = Scheduler(concurrency=1)
+    order = []
+
+    def request(priority):
+        with scheduler.slot(priority):
+            order.append(priority)
+
+    threads = []
+    with scheduler.slot(INTERACTIVE):
+        # queued lowest priority first, so FIFO order would be the reverse
+        for priority in (BATCH, PREFETCH, INTERACTIVE):
+            t = threading.Thread(target=request, args=(priority,))
+            t.start()
+            threads.append(t)
+            _wait_for(lambda: _queued(scheduler, priority) == 1)
+
+    for t in threads:
+        t.join(5)
+    assert order == [INTERACTIVE, PREFETCH, BATCH]
+
+
+def test_full_queue_rejects_at_once():
+    limits = {p: (1, 60.0) for p in PRIORITY_NAMES}
+    scheduler = Scheduler(concurrency=1, limits=limits)
+
+    def request():
+        with scheduler.slot(BATCH):
+            pass
+
+    waiter = threading.Thread(target=request)
+    with scheduler.slot(INTERACTIVE):
+        waiter.start()
+        _wait_for(lambda: _queued(scheduler, BATCH) == 1)
+
+        started = time.monotonic()
+        with pytest.raises(SchedulerBusy):
+            with scheduler.slot(BATCH):
+                pass
+        assert time.monotonic() - started < 1.0
+
+    waiter.join(5)
+    stats = scheduler.metrics()["classes"]["batch"]
+    assert stats["rejected"] == 1
+    assert stats["admitted"] == 1
+
+
+def test_gives_up_after_max_wait():
+    limits = {p: (8, 0.05) for p in PRIORITY_NAMES}
+    scheduler = Scheduler(concurrency=1, limits=limits)
+
+    with scheduler.slot(INTERACTIVE):
+        with pytest.raises(SchedulerBusy):
+            with scheduler.slot(PREFETCH):
+                pass
+
+    metrics = scheduler.metrics()
+    assert metrics["classes"]["prefetch"]["timed_out"] == 1
+    assert metrics["queue_depth"]["prefetch"] == 0
+    # the abandoned ticket doesn't block the next request
+    with scheduler.slot(PREFETCH):
+        pass
+
+
+def test_priority_scope_sets_the_default():
+    assert current_priority() == INTERACTIVE
+    with priority_scope(BATCH):
+        assert current_priority() == BATCH
+    assert current_priority() == INTERACTIVE
@@ -0,0 +1,101 @@
+import pytest
+
+import disk_cache
+import near_dup
+from disk_cache import DiskCache
+
+RESUME = """Ada Lovelace
+ada@example.com
+SUMMARY
+Backend engineer who builds data pipelines and internal tooling for analytics teams.
+EXPERIENCE
+Senior engineer at Analytical Engines Ltd from 2019 to 2024, owning the batch
+scheduling service, the billing exports and the reporting warehouse. Led the move
+from cron scripts to a queue based scheduler and cut nightly runtime by half.
+Engineer at Difference Works from 2015 to 2019, maintaining the order pipeline,
+the payment reconciliation jobs and the customer notification service.
+SKILLS
+Python, SQL, PostgreSQL, Airflow
+"""
+
+PARSED = {
+    "name": "Ada Lovelace",
+    "summary": "Backend engineer",
+    "experience_raw": "Senior engineer at Analytical Engines Ltd",
+    "skills_list": ["Python", "SQL", "PostgreSQL", "Airflow"],
+}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(disk_cache, "_cache", cache)
+    return cache
+
+
+class FakeParser:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return dict(self.result)
+
+
+def test_similar_texts_share_a_bucket(cache):
+    index = near_dup.LSHIndex(cache)
+    sig = near_dup.minhash(RESUME)
+    index.add("doc", sig)
+
+    edited = near_dup.minhash(RESUME.replace("Airflow", "Airflow, Kafka"))
+    matches = index.query(edited)
+    assert [key for _, key in matches] == ["doc"]
+    assert index.query(near_dup.minhash("an unrelated cover letter about gardening")) == []
+
+
+def test_repeated_adds_keep_every_member(cache):
+    index = near_dup.LSHIndex(cache)
+    sig = near_dup.minhash(RESUME)
+    for key in ("a", "b", "a"):
+        index.add(key, sig)
+
+    buckets = cache.get_many(near_dup.LSH_NAMESPACE, near_dup.band_keys(sig))
+    assert all(members == ["a", "b"] for members in buckets.values())
+
+
+def test_exact_repeat_skips_the_parser(cache):
+    first = FakeParser(PARSED)
+    assert near_dup.parse_with_reuse(RESUME, first) == PARSED
+
+    again = FakeParser(PARSED)
+    assert near_dup.parse_with_reuse(RESUME, again) == PARSED
+    assert again.calls == []
+
+
+def test_near_duplicate_reparses_only_changed_sections(cache):
+    near_dup.parse_with_reuse(RESUME, FakeParser(PARSED))
+
+    skills = ["Python", "SQL", "PostgreSQL", "Airflow", "Kafka"]
+    partial = FakeParser({"skills_list": skills, "soft_options": []})
+    edited = RESUME.replace("Airflow", "Airflow, Kafka")
+    parsed = near_dup.parse_with_reuse(edited, partial)
+
+    assert len(partial.calls) == 1
+    assert partial.calls[0].startswith("SKILLS")
+    assert "EXPERIENCE" not in partial.calls[0]
+    assert parsed["skills_list"] == skills
+    assert parsed["experience_raw"] == PARSED["experience_raw"]
+
+
+def test_failed_partial_parse_is_not_retried_in_full(cache):
+    near_dup.parse_with_reuse(RESUME, FakeParser(PARSED))
+
+    down = FakeParser({"skills_list": [], "soft_options": []})
+    edited = RESUME.replace("Airflow", "Airflow, Kafka")
+    parsed = near_dup.parse_with_reuse(edited, down)
+
+    assert len(down.calls) == 1
+    assert not any(parsed.values())
+    # an empty result is not cached
+    assert cache.get(near_dup.PARSE_NAMESPACE, near_dup.text_digest(edited)) is None
@@ -0,0 +1,153 @@
+import json
+import os
+import re
+from collections import namedtuple
+
+# ---------------------------------------
+# TEXT RULES (CONFIG)
+# ---------------------------------------
+# data/text_rules.json ships the defaults; RESUME_TEXT_RULES may point to a
+# JSON file whose keys replace the matching defaults
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "text_rules.json")
+
+
+def load_rules(path=RULES_PATH):
+    with open(path, encoding="utf-8") as f:
+        rules = json.load(f)
+
+    override = os.environ.get("RESUME_TEXT_RULES")
+    if override:
+        with open(override, encoding="utf-8") as f:
+            rules.update(json.load(f))
+
+    return rules
+
+
+RULES = load_rules()
+
+FORBIDDEN_TERMS = set(RULES["forbidden_terms"])
+META_PHRASES = list(RULES["meta_phrases"])
+BANNED_WORDS = set(RULES["banned_words"])
+JUNK_WORDS = set(RULES["junk_words"])
+POSITIVE_TRAITS = set(RULES["positive_traits"])
+SELF_REFERENCES = list(RULES["self_references"])
+INPUT_TYPES = dict(RULES["input_types"])        # checked in file order
+
+# ---------------------------------------
+# COMPILED MATCHERS (BUILT ONCE)
+# ---------------------------------------
+def _alternation(phrases):
+    # longest first so "business growth" wins over any shorter prefix
+    return "|".join(re.escape(p) for p in sorted(set(phrases), key=len, reverse=True))
+
+
+WORD_RE = re.compile(r"[a-z]+")
+SPACES_RE = re.compile(r"\s{2,}")
+FORBIDDEN_RE = re.compile(rf"\b(?:{_alternation(FORBIDDEN_TERMS)})\b", re.IGNORECASE)
+META_RE = re.compile(_alternation(META_PHRASES))
+SELF_REFERENCE_RE = re.compile(_alternation(SELF_REFERENCES))
+
+_INPUT_TYPE_OF = {}
+for _kind, _phrases in INPUT_TYPES.items():
+    for _p in _phrases:
+        _INPUT_TYPE_OF.setdefault(_p, _kind)
+INPUT_TYPE_RE = re.compile(_alternation(_INPUT_TYPE_OF))
+_INPUT_TYPE_RANK = {kind: i for i, kind in enumerate(INPUT_TYPES)}
+
+# ---------------------------------------
+# SHARED TOKEN STREAM
+# ---------------------------------------
+TextAnalysis = namedtuple("TextAnalysis", ["text", "lower", "words", "word_set"])
+
+
+def analyze(text):
+    # tokenize once; every classifier below accepts the result
+    if isinstance(text, TextAnalysis):
+        return text
+    text = text or ""
+    lower = text.lower().strip()
+    words = WORD_RE.findall(lower)
+    return TextAnalysis(text, lower, words, frozenset(words))
+
+
+# ---------------------------------------
+# FILTERS
+# ---------------------------------------
+def remove_meta_text(text: str) -> str:
+    clean_lines = [line for line in text.splitlines() if not META_RE.search(line.lower())]
+    return " ".join(clean_lines).strip()
+
+
+def sanitize_summary(text: str) -> str:
+    text = FORBIDDEN_RE.sub("", text)
+    text = SPACES_RE.sub(" ", text)
+    return text.strip()
+
+
+# ---------------------------------------
+# CLASSIFIERS
+# ---------------------------------------
+def is_intent_based_summary(text) -> bool:
+    a = analyze(text)
+    if not a.lower:
+        return False
+
+    # must indicate self-description and contain a positive trait
+    has_self_reference = SELF_REFERENCE_RE.search(a.lower) is not None
+    has_positive_trait = bool(a.word_set & POSITIVE_TRAITS)
+
+    return has_self_reference and has_positive_trait
+
+
+def classify_input(text) -> str:
+    a = analyze(text)
+    found = {_INPUT_TYPE_OF[m.group()] for m in INPUT_TYPE_RE.finditer(a.lower)}
+    if not found:
+        return "neutral"
+    return min(found, key=_INPUT_TYPE_RANK.__getitem__)
+
+
+def is_invalid_summary(text: str) -> bool:
+    # reject very short or broken output
+    if len(text.split()) < 12:
+        return True
+    if not text[0].isupper():
+        return True
+    if "." not in text:
+        return True
+    return False
+
+
+def is_low_quality_summary(text) -> bool:
+    a = analyze(text)
+    if not a.lower:
+        return True
+
+    if len(a.lower) < 20:
+        return True
+
+    if len(a.words) < 4:
+        return True
+
+    if a.word_set <= JUNK_WORDS:
+        return True
+
+    if len(a.word_set) <= 2:
+        return True
+
+    return False
+
+
+def banned_word_hits(text):
+    return sorted(analyze(text).word_set & BANNED_WORDS)
+
+
+def profile(text):
+    # all classifiers over one token stream
+    a = analyze(text)
+    return {
+        "input_type": classify_input(a),
+        "intent_based": is_intent_based_summary(a),
+        "low_quality": is_low_quality_summary(a),
+        "banned_words": banned_word_hits(a),
+    }